@@ -1,19 +1,30 @@
 """
 Package initialization file for video uploader.
+
+Heavy submodules (and the Google API stack they pull in) are imported lazily
+on first attribute access, so importing the package stays cheap.
 """
+import importlib
 
-from .config import VideoConfig, create_default_config
 from .exceptions import *
-from .video_processor import VideoProcessor, FilenameParser
-from .youtube_uploader import YouTubeUploader, FallbackUploader
-from .main import VideoUploadManager
 
 __version__ = "2.0.0"
 __author__ = "rudikiaz"
 
+# Maps public attribute name -> submodule that defines it
+_LAZY = {
+    'VideoConfig': 'config',
+    'create_default_config': 'config',
+    'VideoProcessor': 'video_processor',
+    'FilenameParser': 'video_processor',
+    'YouTubeUploader': 'youtube_uploader',
+    'FallbackUploader': 'youtube_uploader',
+    'VideoUploadManager': 'main',
+}
+
 __all__ = [
     'VideoConfig',
-    'create_default_config', 
+    'create_default_config',
     'VideoProcessor',
     'FilenameParser',
     'YouTubeUploader',
@@ -24,8 +35,23 @@ __all__ = [
     'ConfigurationError',
     'VideoProcessingError',
     'FFmpegError',
+    'IncompatibleVideosError',
     'YouTubeUploadError',
     'AuthenticationError',
     'FileOperationError',
     'InvalidFilenameError'
 ]
+
+
+def __getattr__(name):
+    """Import the submodule defining ``name`` on first access."""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module('.' + _LAZY[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
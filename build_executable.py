@@ -7,46 +7,153 @@ External dependencies (ffmpeg, config files, credentials) are kept separate.
 """
 import os
 import sys
-import shutil
-import subprocess
+import argparse
+import importlib.util
+import json
+import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
+# Checked-in PyInstaller spec used for every build
+SPEC_FILE = 'youtube_uploader.spec'
+
+# Marker line in youtube_uploader.py replaced by the embedded secrets block
+EMBED_SECRETS_SENTINEL = '# __EMBED_SECRETS__\n'
+
+# One-folder bundle produced by the spec's COLLECT stage
+BUNDLE_DIR = 'dist/youtube_uploader'
+
+# Work directory kept across incremental builds so Analysis results are reused
+INCREMENTAL_WORKPATH = 'build-cache'
+
+# Lines of PyInstaller output repeated after a failed build
+BUILD_LOG_TAIL_LINES = 200
+
+# Build-time copy of the application sources that PyInstaller analyses; the
+# embedded-secrets rewrite happens here so tracked files are never modified
+STAGING_DIR = 'build_tmp'
+
+# Application modules bundled into the executable
+APP_MODULES = ['run.py', 'main.py', 'config.py', 'exceptions.py', 'retry.py',
+               'video_processor.py', 'youtube_uploader.py']
+
+
 def check_pyinstaller():
-    """Check if PyInstaller is installed."""
-    try:
-        import PyInstaller
+    """
+    Check if PyInstaller is installed.
+    
+    PyInstaller is listed in requirements.txt, so the pip fallback below
+    should only fire on environments that skipped the normal install.
+    """
+    import subprocess
+    
+    # find_spec only consults the import finders; it does not execute PyInstaller
+    if importlib.util.find_spec("PyInstaller") is not None:
         print("✅ PyInstaller is available")
         return True
-    except ImportError:
-        print("❌ PyInstaller not found. Installing...")
-        try:
-            subprocess.check_call([sys.executable, "-m", "pip", "install", "pyinstaller>=5.10.0"])
-            print("✅ PyInstaller installed successfully")
-            return True
-        except subprocess.CalledProcessError:
-            print("❌ Failed to install PyInstaller")
-            return False
+    
+    print("❌ PyInstaller not found. Installing...")
+    try:
+        # close_fds=False lets subprocess use posix_spawn where available
+        subprocess.run(
+            [sys.executable, "-m", "pip", "install", "pyinstaller>=5.10.0"],
+            check=True,
+            close_fds=False
+        )
+        print("✅ PyInstaller installed successfully")
+        return True
+    except subprocess.CalledProcessError:
+        print("❌ Failed to install PyInstaller")
+        return False
+
+
+def check_upx():
+    """
+    Check whether UPX is available to compress the bundle.
+    
+    PyInstaller silently skips compression when UPX is missing, so warn here.
+    Set UPX_DIR to point at an UPX install that is not on PATH.
+    """
+    import shutil
+    
+    upx_dir = os.environ.get('UPX_DIR')
+    if upx_dir:
+        found = shutil.which('upx', path=upx_dir)
+    else:
+        found = shutil.which('upx')
+    
+    if found:
+        print(f"✅ UPX is available: {found}")
+        return True
+    
+    print("⚠️  UPX not found - the bundle will be built without compression")
+    print("   Install UPX from https://upx.github.io/ or set UPX_DIR")
+    return False
+
+
+def _report_remove_error(func, path, exc):
+    """
+    rmtree error handler: warn and keep going instead of aborting the clean.
+    
+    ``exc`` is the exception (``onexc``, Python 3.12+) or an exc_info tuple
+    (``onerror``).
+    """
+    if isinstance(exc, tuple):
+        exc = exc[1]
+    print(f"⚠️  Could not remove {path}: {exc}")
+
+
+def _remove_dir(dir_name):
+    """Remove a build directory tree."""
+    import shutil
+    
+    print(f"🧹 Cleaning {dir_name}/")
+    if sys.version_info >= (3, 12):
+        shutil.rmtree(dir_name, onexc=_report_remove_error)
+    else:
+        # onexc doesn't exist yet; onerror is deprecated from 3.12
+        shutil.rmtree(dir_name, onerror=_report_remove_error)
+
+
+def _remove_file(path):
+    """Remove a single build artifact, ignoring it if missing."""
+    print(f"🧹 Removing {path}")
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
 
 
 def clean_build_dirs():
     """Clean previous build directories."""
-    dirs_to_clean = ['build', 'dist', '__pycache__']
-    
-    for dir_name in dirs_to_clean:
-        if os.path.exists(dir_name):
-            print(f"🧹 Cleaning {dir_name}/")
-            shutil.rmtree(dir_name)
+    dirs_to_clean = [d for d in ('build', 'dist', STAGING_DIR) if os.path.isdir(d)]
     
-    # Clean .spec files
-    for spec_file in Path('.').glob('*.spec'):
-        print(f"🧹 Removing {spec_file}")
-        spec_file.unlink()
+    # The trees are disjoint and removal is I/O bound, so clean them concurrently
+    # with one worker per tree
+    with ThreadPoolExecutor(max_workers=max(1, len(dirs_to_clean))) as executor:
+        list(executor.map(_remove_dir, dirs_to_clean))
+        
+        # Clean stray .spec files, keeping the checked-in build spec
+        with os.scandir('.') as entries:
+            stray_specs = [
+                entry.name for entry in entries
+                if entry.name.endswith('.spec') and entry.name != SPEC_FILE and entry.is_file()
+            ]
+        list(executor.map(_remove_file, stray_specs))
 
 
 def create_embedded_uploader():
-    """Create a modified youtube_uploader.py file with embedded client secrets."""
-    print("🔐 Embedding client secrets directly into youtube_uploader.py...")
+    """
+    Stage the application sources in STAGING_DIR with client secrets embedded.
+    
+    The other modules are copied unchanged; youtube_uploader.py is written in
+    its rewritten form. The checked-in sources are left untouched.
+    """
+    import shutil
+    
+    print("🔐 Embedding client secrets into the staged youtube_uploader.py...")
     
     # Read client secrets
     client_secrets_path = 'client_secrets.json'
@@ -54,7 +161,6 @@ def create_embedded_uploader():
         print(f"❌ Client secrets file not found: {client_secrets_path}")
         return False
     
-    import json
     with open(client_secrets_path, 'r') as f:
         client_secrets = json.load(f)
     
@@ -62,32 +168,23 @@ def create_embedded_uploader():
     with open('youtube_uploader.py', 'r', encoding='utf-8') as f:
         original_code = f.read()
     
-    # Create backup
-    with open('youtube_uploader_backup.py', 'w', encoding='utf-8') as f:
-        f.write(original_code)
-    
     # Embed client secrets at the top of the file
+    # (stored as a bytes constant and only decoded when credentials are needed)
+    secrets_json = json.dumps(client_secrets, separators=(',', ':')).encode('utf-8')
     embedded_secrets_code = f'''
 # Embedded client secrets for executable
-EMBEDDED_CLIENT_SECRETS = {json.dumps(client_secrets, indent=4)}
+EMBEDDED_CLIENT_SECRETS_JSON = {secrets_json!r}
 
-import tempfile
+import functools
 import json
+
+
+@functools.lru_cache(maxsize=1)
+def _embedded_secrets() -> dict:
+    """Decode the embedded client secrets on first use."""
+    return json.loads(EMBEDDED_CLIENT_SECRETS_JSON)
 '''
     
-    # Insert embedded secrets after the imports section
-    import_section_end = original_code.find('logger = logging.getLogger(__name__)')
-    if import_section_end == -1:
-        print("❌ Could not find logger definition in youtube_uploader.py")
-        return False
-    
-    # Insert the embedded code before the logger line
-    modified_code = (
-        original_code[:import_section_end] + 
-        embedded_secrets_code + 
-        original_code[import_section_end:]
-    )
-    
     # Replace the _get_credentials method to use embedded secrets
     old_get_credentials = '''    def _get_credentials(self) -> Credentials:
         """
@@ -167,57 +264,12 @@ import json
                     creds = None
             
             if not creds:
-                # Use embedded client secrets
-                temp_secrets_file = None
                 try:
-                    # Create temporary file with embedded secrets
-                    temp_file = tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False)
-                    json.dump(EMBEDDED_CLIENT_SECRETS, temp_file, indent=2)
-                    temp_file.close()
-                    temp_secrets_file = temp_file.name
-                    
-                    flow = InstalledAppFlow.from_client_secrets_file(
-                        temp_secrets_file, self.config.youtube_scopes
+                    # Use embedded client secrets
+                    flow = InstalledAppFlow.from_client_config(
+                        _embedded_secrets(), self.config.youtube_scopes
                     )'''
     
-    modified_code = modified_code.replace(old_get_credentials, new_get_credentials)
-    
-    # Also add cleanup for temp file at the end of the method
-    old_method_end = '''                except Exception as e:
-                    raise AuthenticationError(f"Failed to obtain new credentials: {e}")
-        
-        # Save credentials
-        try:
-            with open(self.config.youtube_credentials, 'w') as token:
-                token.write(creds.to_json())
-            logger.debug("Saved credentials to file")
-        except Exception as e:
-            logger.warning(f"Failed to save credentials: {e}")
-        
-        return creds'''
-    
-    new_method_end = '''                except Exception as e:
-                    raise AuthenticationError(f"Failed to obtain new credentials: {e}")
-                finally:
-                    # Clean up temporary secrets file
-                    if temp_secrets_file:
-                        try:
-                            os.unlink(temp_secrets_file)
-                        except:
-                            pass
-        
-        # Save credentials
-        try:
-            with open(self.config.youtube_credentials, 'w') as token:
-                token.write(creds.to_json())
-            logger.debug("Saved credentials to file")
-        except Exception as e:
-            logger.warning(f"Failed to save credentials: {e}")
-        
-        return creds'''
-    
-    modified_code = modified_code.replace(old_method_end, new_method_end)
-    
     # Enable web OAuth by default - modify the authentication logic
     old_auth_logic = '''                    # Check if manual flow is forced or if we're in a headless environment
                     force_manual = os.getenv('FORCE_MANUAL_OAUTH', '').lower() in ('true', '1', 'yes')
@@ -272,123 +324,140 @@ import json
                         creds = self._manual_oauth_flow(flow)
                         logger.info("Obtained new credentials via manual flow")'''
     
-    modified_code = modified_code.replace(old_auth_logic, new_auth_logic)
+    # Apply every rewrite in a single scan of the source: the secrets block
+    # replaces the EMBED_SECRETS_SENTINEL line, the rest swap out code blocks
+    rewrites = {
+        EMBED_SECRETS_SENTINEL: embedded_secrets_code,
+        old_get_credentials: new_get_credentials,
+        old_auth_logic: new_auth_logic,
+    }
+    pattern = re.compile("|".join(re.escape(marker) for marker in rewrites))
+    applied = set()
+    
+    def _dispatch(match):
+        applied.add(match.group(0))
+        return rewrites[match.group(0)]
+    
+    modified_code = pattern.sub(_dispatch, original_code)
     
-    # Write the modified version
-    with open('youtube_uploader.py', 'w', encoding='utf-8') as f:
+    if len(applied) != len(rewrites):
+        missing = len(rewrites) - len(applied)
+        print(f"❌ {missing} expected code block(s) not found in youtube_uploader.py")
+        return False
+    
+    # Stage the sources: unchanged copies plus the modified uploader
+    os.makedirs(STAGING_DIR, exist_ok=True)
+    for module in APP_MODULES:
+        if module != 'youtube_uploader.py':
+            shutil.copy2(module, os.path.join(STAGING_DIR, module))
+    
+    with open(os.path.join(STAGING_DIR, 'youtube_uploader.py'), 'w', encoding='utf-8') as f:
         f.write(modified_code)
     
-    print("✅ Successfully embedded client secrets into youtube_uploader.py")
+    print(f"✅ Staged sources with embedded client secrets in {STAGING_DIR}/")
     return True
 
 
-def create_build_spec():
-    """Create PyInstaller spec file for custom build configuration."""
-    spec_content = """# -*- mode: python ; coding: utf-8 -*-
-
-block_cipher = None
-
-# List of Python modules to include
-a = Analysis(
-    ['run.py'],
-    pathex=[],
-    binaries=[],
-    datas=[],
-    hiddenimports=[
-        'google.auth',
-        'google.oauth2',
-        'google_auth_oauthlib',
-        'googleapiclient',
-        'main',
-        'config',
-        'exceptions',
-        'video_processor',
-        'youtube_uploader',
-    ],
-    hookspath=[],
-    hooksconfig={},
-    runtime_hooks=[],
-    excludes=[
-        'tkinter',
-        'matplotlib',
-        'numpy',
-        'pandas',
-        'scipy',
-        'PIL',
-        'PyQt5',
-        'PyQt6',
-        'PySide2',
-        'PySide6',
-    ],
-    win_no_prefer_redirects=False,
-    win_private_assemblies=False,
-    cipher=block_cipher,
-    noarchive=False,
-)
-
-pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
-
-exe = EXE(
-    pyz,
-    a.scripts,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
-    [],
-    name='youtube_uploader',
-    debug=False,
-    bootloader_ignore_signals=False,
-    strip=False,
-    upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
-    console=True,
-    disable_windowed_traceback=False,
-    argv_emulation=False,
-    target_arch=None,
-    codesign_identity=None,
-    entitlements_file=None,
-    icon=None,
-)
-"""
+def check_sources_compile():
+    """
+    Check that the staged application modules compile, so syntax errors
+    fail the build before PyInstaller runs.
+    
+    No bytecode is written: PyInstaller compiles the bundled modules from
+    source itself (optimisation comes from PYTHONOPTIMIZE, see
+    build_executable).
+    """
+    print("⚙️  Checking application module syntax...")
     
-    with open('youtube_uploader.spec', 'w') as f:
-        f.write(spec_content)
+    for module in APP_MODULES:
+        path = os.path.join(STAGING_DIR, module)
+        try:
+            with open(path, 'rb') as f:
+                compile(f.read(), path, 'exec', dont_inherit=True)
+        except (OSError, SyntaxError) as e:
+            print(f"❌ Syntax check failed for {module}: {e}")
+            return False
     
-    print("✅ Created PyInstaller spec file")
+    print("✅ Application module syntax OK")
+    return True
 
 
-def build_executable():
-    """Build the executable using PyInstaller."""
+def build_executable(incremental: bool = False):
+    """
+    Build the executable using PyInstaller.
+    
+    Args:
+        incremental: Reuse PyInstaller's Analysis cache in INCREMENTAL_WORKPATH
+            instead of starting from a clean work directory.
+    """
+    import subprocess
+    
     print("🔨 Building executable...")
     
-    cmd = [
-        sys.executable, "-m", "PyInstaller",
-        "--clean",
-        "--noconfirm",
-        "youtube_uploader.spec"
-    ]
+    cmd = [sys.executable, "-m", "PyInstaller", "--noconfirm"]
+    
+    if incremental:
+        cmd.extend(["--workpath", INCREMENTAL_WORKPATH])
+    else:
+        cmd.append("--clean")
+    
+    upx_dir = os.environ.get('UPX_DIR')
+    if upx_dir:
+        cmd.extend(["--upx-dir", upx_dir])
+    
+    cmd.append(SPEC_FILE)
+    
+    # Run PyInstaller at -OO so the bundled bytecode drops asserts and
+    # docstrings (works for PyInstaller 5.x and 6.x, whose Analysis defaults
+    # to the interpreter's optimization level). Also keep the analysis from
+    # scattering __pycache__ files and make its hashing deterministic.
+    env = {
+        **os.environ,
+        'PYTHONOPTIMIZE': '2',
+        'PYTHONDONTWRITEBYTECODE': '1',
+        'PYTHONHASHSEED': '0',
+    }
     
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        # Stream PyInstaller output live instead of buffering the whole log
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+            close_fds=False,
+            env=env
+        )
+        # Keep only a bounded tail for the failure summary
+        tail = deque(maxlen=BUILD_LOG_TAIL_LINES)
+        for line in proc.stdout:
+            sys.stdout.write(line)
+            tail.append(line)
+        returncode = proc.wait()
         
-        if result.returncode == 0:
+        if returncode == 0:
             print("✅ Executable built successfully!")
             return True
         else:
-            print("❌ Build failed!")
-            print("STDOUT:", result.stdout)
-            print("STDERR:", result.stderr)
+            print(f"❌ Build failed! (exit code {returncode})")
+            print(f"Last {len(tail)} lines of PyInstaller output:")
+            sys.stdout.writelines(tail)
             return False
             
-    except subprocess.CalledProcessError as e:
+    except OSError as e:
         print(f"❌ Build failed: {e}")
         return False
 
 
 def create_distribution_package():
     """Create a distribution package with the executable and required files."""
-    if not os.path.exists('dist/youtube_uploader.exe'):
+    import shutil
+    
+    # config.py pulls in shutil and subprocess, so only load it here
+    from config import DEFAULT_CONFIG_JSON
+    
+    if not os.path.exists(f'{BUNDLE_DIR}/youtube_uploader.exe'):
         print("❌ Executable not found!")
         return False
     
@@ -399,39 +468,10 @@ def create_distribution_package():
     
     dist_dir.mkdir()
     
-    # Copy executable
-    shutil.copy2('dist/youtube_uploader.exe', dist_dir / 'youtube_uploader.exe')
+    # Copy the one-folder bundle (executable plus its DLLs and archives)
+    shutil.copytree(BUNDLE_DIR, dist_dir / 'youtube_uploader')
     print("✅ Copied executable with embedded client secrets")
     
-    # Create example config file (without sensitive data)
-    example_config = {
-        "video_dir": "C:/Videos/recorder",
-        "log_file": "uploaded.txt",
-        "temp_dir": "temp_merged",
-        "ffmpeg_path": "./ffmpeg.exe",
-        "ffprobe_path": "./ffprobe.exe",
-        "youtube_client_secrets": "client_secrets.json",  # Not used, but kept for compatibility
-        "youtube_credentials": "youtube_credentials.json",
-        "youtube_scopes": ["https://www.googleapis.com/auth/youtube.upload"],
-        "early_morning_cutoff": 4,
-        "max_file_size_gb": 2.0,
-        "video_quality": "1440p",
-        "default_privacy": "private",
-        "default_category": "20",
-        "default_tags": ["gaming", "arena", "pvp"],
-        "merged_video_title_template": "Rudikiaz arenas for {date}",
-        "individual_video_title_template": "{username} {activity}",
-        "max_retries": 3,
-        "retry_delay": 5,
-        "delete_after_upload": True
-    }
-    
-    import json
-    with open(dist_dir / 'config.json.example', 'w') as f:
-        json.dump(example_config, f, indent=2)
-    
-    print("✅ Created example config file")
-    
     # Create README for distribution
     readme_content = """# YouTube Video Uploader - Executable Distribution (Embedded Secrets)
 
@@ -449,7 +489,8 @@ def create_distribution_package():
    - Or install FFmpeg system-wide and update paths in config.json
 
 3. **Run the uploader:**
-   youtube_uploader.exe
+   run_uploader.bat
+   (or youtube_uploader\\youtube_uploader.exe from this directory)
 
 ## Authentication
 
@@ -467,12 +508,14 @@ On first run:
 If automatic browser opening fails, set environment variable:
 ```
 set FORCE_MANUAL_OAUTH=true
-youtube_uploader.exe
+youtube_uploader\\youtube_uploader.exe
 ```
 
 ## File Structure
 distribution/
-├── youtube_uploader.exe     # Main executable (with embedded secrets)
+├── youtube_uploader/        # Application folder (keep its contents together)
+│   └── youtube_uploader.exe # Main executable (with embedded secrets)
+├── run_uploader.bat        # Starts the uploader from this directory
 ├── config.json.example     # Configuration template
 ├── config.json            # Your configuration (create this)
 ├── ffmpeg.exe             # Video processing (you provide)
@@ -486,7 +529,7 @@ distribution/
 - Client secrets are embedded in the executable - no external secrets file needed
 - Web OAuth authentication is enabled by default for better user experience
 - First run will prompt for YouTube authentication via browser
-- Config file must be in the same directory as the executable
+- Config file must be in the directory the uploader is started from (this one)
 - Log files and temporary directories are created automatically
 
 ## Troubleshooting
@@ -502,31 +545,41 @@ distribution/
 - `FORCE_MANUAL_OAUTH=true` - Force manual OAuth flow instead of web browser
 """
     
-    with open(dist_dir / 'README.txt', 'w', encoding='utf-8') as f:
-        f.write(readme_content)
-    
-    print("✅ Created distribution README")
-    
     # Create batch file for easy execution
     batch_content = """@echo off
 echo Starting YouTube Video Uploader...
 echo.
-youtube_uploader.exe
+youtube_uploader\\youtube_uploader.exe
 echo.
 echo Upload process completed.
 pause
 """
     
-    with open(dist_dir / 'run_uploader.bat', 'w') as f:
-        f.write(batch_content)
+    # Write the example config (without sensitive data) and the text files
+    # concurrently. Newlines are pinned per file rather than left to the
+    # platform: LF for the README, CRLF for the batch file as cmd.exe expects.
+    def _write_text(item):
+        name, content, newline = item
+        with open(dist_dir / name, 'w', encoding='utf-8', newline=newline) as f:
+            f.write(content)
+    
+    text_files = [
+        ('config.json.example', DEFAULT_CONFIG_JSON, '\n'),
+        ('README.txt', readme_content, '\n'),
+        ('run_uploader.bat', batch_content, '\r\n'),
+    ]
+    with ThreadPoolExecutor(max_workers=len(text_files)) as executor:
+        list(executor.map(_write_text, text_files))
     
+    print("✅ Created example config file")
+    print("✅ Created distribution README")
     print("✅ Created run batch file")
     
     print(f"\n🎉 Distribution package created in: {dist_dir.absolute()}")
     print("\nTo complete the setup:")
     print("1. Copy config.json.example to config.json and edit it")
     print("2. Add ffmpeg.exe and ffprobe.exe")
-    print("3. Run youtube_uploader.exe or run_uploader.bat")
+    print("3. Run run_uploader.bat")
     print("\n🔐 Client secrets are embedded - no additional API setup needed!")
     print("🌐 Web OAuth authentication will start automatically on first run")
     
@@ -535,27 +588,38 @@ pause
 
 def main():
     """Main build process."""
+    parser = argparse.ArgumentParser(description="Build the YouTube Video Uploader executable")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=f"Reuse the PyInstaller cache in {INCREMENTAL_WORKPATH}/ instead of a clean build"
+    )
+    args = parser.parse_args()
+    
     print("🚀 YouTube Video Uploader - Build Script (with embedded secrets)")
     print("=" * 60)
     
     # Check dependencies
     if not check_pyinstaller():
         sys.exit(1)
+    check_upx()
     
     # Clean previous builds
-    clean_build_dirs()
-    
-    # Create embedded uploader with hardcoded client secrets
-    if not create_embedded_uploader():
-        sys.exit(1)
+    if not args.incremental:
+        clean_build_dirs()
     
     try:
-        # Create build specification
-        create_build_spec()
+        # Create embedded uploader with hardcoded client secrets
+        if not create_embedded_uploader():
+            sys.exit(1)
+        
+        # Syntax-check sources before handing them to PyInstaller
+        if not check_sources_compile():
+            sys.exit(1)
         
         # Build executable
-        if not build_executable():
-            print("❌ Build failed - restoring original files")
+        if not build_executable(incremental=args.incremental):
+            print("❌ Build failed")
             sys.exit(1)
         
         # Create distribution package
@@ -567,12 +631,9 @@ def main():
         print(f"❌ Build process failed: {e}")
         sys.exit(1)
     finally:
-        # Restore original uploader if backup exists
-        if os.path.exists('youtube_uploader_backup.py'):
-            if os.path.exists('youtube_uploader.py'):
-                os.remove('youtube_uploader.py')
-            shutil.move('youtube_uploader_backup.py', 'youtube_uploader.py')
-            print("🔄 Restored original youtube_uploader.py")
+        # The staged uploader holds the client secrets in plain text; don't
+        # leave it behind (incremental builds never clean STAGING_DIR)
+        _remove_file(os.path.join(STAGING_DIR, 'youtube_uploader.py'))
     
     print("\n✅ Build completed successfully!")
     print("📦 Check the 'distribution' folder for your executable package")
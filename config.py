@@ -3,17 +3,118 @@ Configuration module for video uploader.
 Handles all configuration parameters and environment variables.
 """
 import os
+import copy
 import logging
+import shutil
+import functools
 import subprocess
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 from dataclasses import dataclass
 import json
 
+# orjson is an optional, faster drop-in; the stdlib json module is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 logger = logging.getLogger(__name__)
 
 
+def json_loads(data: bytes):
+    """Parse JSON from bytes (orjson when installed, stdlib json otherwise)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj) -> str:
+    """Serialize to JSON text indented by two spaces, like json.dumps(indent=2)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(obj, indent=2)
+
+
+# Default settings written to new config files (mirrors the from_env defaults)
+DEFAULT_CONFIG = {
+    "video_dir": "d:/VIDEOS/recorder",
+    "log_file": "uploaded.txt",
+    "temp_dir": "temp_merged",
+    "ffmpeg_path": "./ffmpeg.exe",
+    "ffprobe_path": "./ffprobe.exe",
+    "youtube_client_secrets": "client_secrets.json",
+    "youtube_credentials": "youtube_credentials.json",
+    "youtube_scopes": ["https://www.googleapis.com/auth/youtube.upload"],
+    "early_morning_cutoff": 4,
+    "max_file_size_gb": 2.0,
+    "video_quality": "720p",
+    "default_privacy": "private",
+    "default_category": "20",
+    "default_tags": ["gaming", "arena", "pvp"],
+    "merged_video_title_template": "Rudikiaz arenas for {date}",
+    "individual_video_title_template": "{username} {activity}",
+    "max_retries": 3,
+    "retry_delay": 5,
+    "concurrency": 2,
+    "uploads_per_minute": 30,
+    "delete_after_upload": True
+}
+
+# Serialized once at import; written verbatim wherever a default config is needed
+DEFAULT_CONFIG_JSON = json_dumps(DEFAULT_CONFIG)
+
+
+# Normalized absolute paths already created (or confirmed) in this process
+_ENSURED_DIRS = set()
+
+
+def _ensure_dir(path: str) -> None:
+    """Create a directory once per process, skipping the syscall on repeats."""
+    norm = os.path.normcase(os.path.abspath(path))
+    if norm in _ENSURED_DIRS:
+        return
+    os.makedirs(path, exist_ok=True)
+    _ENSURED_DIRS.add(norm)
+
+
+# Resolved executable path -> whether running it with '-version' succeeded
+_EXECUTABLE_PROBES = {}
+
+
+def _probe_executable(path: str, verified: bool = False) -> bool:
+    """
+    Check that an executable exists and runs.
+    
+    The file lookup is a cheap PATH/filesystem check; the '-version' launch
+    happens at most once per resolved binary per process, and not at all
+    when ``verified`` says it already succeeded (e.g. during setup).
+    """
+    resolved = shutil.which(path)
+    if resolved is None:
+        return False
+    if verified:
+        return True
+    
+    resolved = os.path.abspath(resolved)
+    if resolved not in _EXECUTABLE_PROBES:
+        try:
+            subprocess.run([resolved, '-version'], capture_output=True, check=True)
+            _EXECUTABLE_PROBES[resolved] = True
+        except (subprocess.CalledProcessError, OSError):
+            _EXECUTABLE_PROBES[resolved] = False
+    
+    return _EXECUTABLE_PROBES[resolved]
+
+
+@functools.lru_cache(maxsize=8)
+def _load_json_cached(config_path: str, mtime: float) -> dict:
+    """Read and parse a JSON config file; mtime is part of the cache key."""
+    with open(config_path, 'rb') as f:
+        return json_loads(f.read())
+
+
 @dataclass
 class VideoConfig:
     """Configuration class for video processing and upload settings."""
@@ -30,7 +131,7 @@ class VideoConfig:
     # YouTube upload settings
     youtube_client_secrets: str
     youtube_credentials: str
-    youtube_scopes: list
+    youtube_scopes: Tuple[str, ...]
     
     # Video processing settings
     early_morning_cutoff: int = 4  # Videos before 4 AM count as previous day
@@ -40,7 +141,7 @@ class VideoConfig:
     # Upload settings
     default_privacy: str = "private"  # private, public, unlisted
     default_category: str = "20"  # Gaming category
-    default_tags: list = None
+    default_tags: Optional[Tuple[str, ...]] = None
     
     # Title settings
     merged_video_title_template: str = "Rudikiaz arenas for {date}"  # Template for merged videos
@@ -50,31 +151,33 @@ class VideoConfig:
     max_retries: int = 3
     retry_delay: int = 5  # seconds
     
+    # Parallelism
+    concurrency: int = 2  # Dates merged/uploaded in parallel
+    uploads_per_minute: int = 30  # Upper bound on upload starts
+    
     # File management
     delete_after_upload: bool = True  # Whether to delete videos after successful upload
     
+    # Recorded by setup.py after it ran ffmpeg successfully; lets startup
+    # skip the '-version' launch for ffmpeg_path
+    ffmpeg_version: Optional[str] = None
+    
     def __post_init__(self):
+        # Immutable tuples: values loaded from JSON arrive as lists
         if self.default_tags is None:
-            self.default_tags = ["gaming", "arena", "pvp"]
-        
-        # Ensure directories exist
-        self._ensure_directories()
-    
-    def _ensure_directories(self):
-        """Ensure required directories exist."""
-        # Create temp directory if it doesn't exist
-        if not os.path.isabs(self.temp_dir):
-            # Relative path - create in current working directory
-            temp_path = os.path.join(os.getcwd(), self.temp_dir)
+            self.default_tags = ("gaming", "arena", "pvp")
         else:
-            temp_path = self.temp_dir
-        
-        os.makedirs(temp_path, exist_ok=True)
-        logger.debug(f"Ensured temp directory exists: {temp_path}")
+            self.default_tags = tuple(self.default_tags)
+        self.youtube_scopes = tuple(self.youtube_scopes)
         
-        # Create video directory if it doesn't exist (and it's absolute)
+        # Directories are created on first use rather than at construction,
+        # so config objects that never touch the filesystem stay cheap
+        self._temp_dir_ready = False
+    
+    def _ensure_video_dir(self):
+        """Create the video directory if it doesn't exist (and it's absolute)."""
         if os.path.isabs(self.video_dir):
-            os.makedirs(self.video_dir, exist_ok=True)
+            _ensure_dir(self.video_dir)
             logger.debug(f"Ensured video directory exists: {self.video_dir}")
     
     def get_full_log_path(self) -> str:
@@ -84,18 +187,40 @@ class VideoConfig:
         return os.path.join(os.getcwd(), self.log_file)
     
     def get_full_temp_path(self) -> str:
-        """Get the full path for the temp directory."""
+        """Get the full path for the temp directory, creating it on first use."""
         if os.path.isabs(self.temp_dir):
-            return self.temp_dir
-        return os.path.join(os.getcwd(), self.temp_dir)
+            temp_path = self.temp_dir
+        else:
+            # Relative path - create in current working directory
+            temp_path = os.path.join(os.getcwd(), self.temp_dir)
+        
+        if not self._temp_dir_ready:
+            _ensure_dir(temp_path)
+            logger.debug(f"Ensured temp directory exists: {temp_path}")
+            self._temp_dir_ready = True
+        
+        return temp_path
     
     @classmethod
-    def from_file(cls, config_path: str) -> 'VideoConfig':
-        """Load configuration from JSON file."""
-        with open(config_path, 'r') as f:
-            config_data = json.load(f)
+    def from_file(cls, config_path: str, mtime: Optional[float] = None) -> 'VideoConfig':
+        """
+        Load configuration from JSON file (parsed once per file modification).
+        
+        Args:
+            config_path: Path to the JSON file
+            mtime: The file's st_mtime, if the caller has already stat'ed it
+        """
+        if mtime is None:
+            mtime = os.path.getmtime(config_path)
+        # Deep copy so instances never share the cached lists
+        config_data = copy.deepcopy(_load_json_cached(config_path, mtime))
         return cls(**config_data)
     
+    @staticmethod
+    def invalidate_cache() -> None:
+        """Drop all cached config file contents."""
+        _load_json_cached.cache_clear()
+    
     @classmethod
     def from_env(cls) -> 'VideoConfig':
         """Load configuration from environment variables with defaults."""
@@ -107,17 +232,19 @@ class VideoConfig:
             ffprobe_path=os.getenv('FFPROBE_PATH', './ffprobe.exe'),
             youtube_client_secrets=os.getenv('YOUTUBE_CLIENT_SECRETS', 'client_secrets.json'),
             youtube_credentials=os.getenv('YOUTUBE_CREDENTIALS', 'youtube_credentials.json'),
-            youtube_scopes=os.getenv('YOUTUBE_SCOPES', 'https://www.googleapis.com/auth/youtube.upload').split(','),
+            youtube_scopes=tuple(os.getenv('YOUTUBE_SCOPES', 'https://www.googleapis.com/auth/youtube.upload').split(',')),
             early_morning_cutoff=int(os.getenv('EARLY_MORNING_CUTOFF', '4')),
             max_file_size_gb=float(os.getenv('MAX_FILE_SIZE_GB', '2.0')),
             video_quality=os.getenv('VIDEO_QUALITY', '720p'),
             default_privacy=os.getenv('DEFAULT_PRIVACY', 'private'),
             default_category=os.getenv('DEFAULT_CATEGORY', '20'),
-            default_tags=os.getenv('DEFAULT_TAGS', 'gaming,arena,pvp').split(','),
+            default_tags=tuple(os.getenv('DEFAULT_TAGS', 'gaming,arena,pvp').split(',')),
             merged_video_title_template=os.getenv('MERGED_VIDEO_TITLE_TEMPLATE', 'Rudikiaz arenas for {date}'),
             individual_video_title_template=os.getenv('INDIVIDUAL_VIDEO_TITLE_TEMPLATE', '{username} {activity}'),
             max_retries=int(os.getenv('MAX_RETRIES', '3')),
             retry_delay=int(os.getenv('RETRY_DELAY', '5')),
+            concurrency=int(os.getenv('CONCURRENCY', '2')),
+            uploads_per_minute=int(os.getenv('UPLOADS_PER_MINUTE', '30')),
             delete_after_upload=os.getenv('DELETE_AFTER_UPLOAD', 'true').lower() in ('true', '1', 'yes')
         )
     
@@ -125,47 +252,26 @@ class VideoConfig:
         """Validate configuration and return list of errors."""
         errors = []
         
+        self._ensure_video_dir()
         if not os.path.exists(self.video_dir):
             errors.append(f"Video directory does not exist: {self.video_dir}")
         
         # Check if ffmpeg/ffprobe are available
-        try:
-            import subprocess
-            subprocess.run([self.ffmpeg_path, '-version'], capture_output=True, check=True)
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        if not _probe_executable(self.ffmpeg_path, verified=self.ffmpeg_version is not None):
             errors.append(f"FFmpeg not found at: {self.ffmpeg_path}")
         
-        try:
-            subprocess.run([self.ffprobe_path, '-version'], capture_output=True, check=True)
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        if not _probe_executable(self.ffprobe_path):
             errors.append(f"FFprobe not found at: {self.ffprobe_path}")
         
+        if self.concurrency < 1:
+            errors.append(f"concurrency must be at least 1, got {self.concurrency}")
+        
+        if self.uploads_per_minute < 1:
+            errors.append(f"uploads_per_minute must be at least 1, got {self.uploads_per_minute}")
+        
         return errors
 
 
 def create_default_config(config_path: str) -> None:
     """Create a default configuration file."""
-    default_config = {
-        "video_dir": "/mnt/d/VIDEOS/recorder",
-        "log_file": "/mnt/d/VIDEOS/recorder/uploaded.txt",
-        "temp_dir": "/mnt/d/VIDEOS/recorder/temp_merged",
-        "ffmpeg_path": "ffmpeg",
-        "ffprobe_path": "ffprobe",
-        "youtube_client_secrets": "client_secrets.json",
-        "youtube_credentials": "youtube_credentials.json",
-        "youtube_scopes": ["https://www.googleapis.com/auth/youtube.upload"],
-        "early_morning_cutoff": 4,
-        "max_file_size_gb": 2.0,
-        "video_quality": "720p",
-        "default_privacy": "private",
-        "default_category": "20",
-        "default_tags": ["gaming", "arena", "pvp"],
-        "merged_video_title_template": "Rudikiaz arenas for {date}",
-        "individual_video_title_template": "{username} {activity}",
-        "max_retries": 3,
-        "retry_delay": 5,
-        "delete_after_upload": True
-    }
-    
-    with open(config_path, 'w') as f:
-        json.dump(default_config, f, indent=2)
+    Path(config_path).write_text(DEFAULT_CONFIG_JSON)
@@ -23,6 +23,11 @@ class FFmpegError(VideoProcessingError):
     pass
 
 
+class IncompatibleVideosError(VideoProcessingError):
+    """Raised when videos cannot be stream-copied into one file."""
+    pass
+
+
 class YouTubeUploadError(VideoUploaderError):
     """Raised when YouTube upload fails."""
     pass
@@ -2,28 +2,133 @@
 Main video uploader application with improved architecture and error handling.
 """
 import os
+import math
+import mmap
+import atexit
+import queue
+import hashlib
 import logging
-import time
-from collections import defaultdict
-from typing import List, Dict, Optional
+import logging.handlers
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import TYPE_CHECKING, Iterator, List, Dict, Optional, Tuple
 from pathlib import Path
 
 from config import VideoConfig, create_default_config
 from exceptions import *
-from video_processor import VideoProcessor, FilenameParser
-from youtube_uploader import YouTubeUploader, FallbackUploader
+from video_processor import VideoProcessor, FilenameParser, MetadataCache, VideoEntry
 
+if TYPE_CHECKING:
+    from youtube_uploader import YouTubeUploader
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
+
+logger = logging.getLogger(__name__)
+
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def setup_logging():
+    """
+    Configure logging to ``video_uploader.log`` and the console.
+    
+    Callers only enqueue records; a background listener owns the file and
+    console handlers, so upload threads never block on log I/O. Only the
+    first call has any effect.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return
+    
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    handlers = [
         logging.FileHandler('video_uploader.log'),
         logging.StreamHandler()
     ]
-)
-logger = logging.getLogger(__name__)
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    log_queue = queue.Queue(-1)
+    root_logger = logging.getLogger()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    root_logger.setLevel(logging.INFO)
+    _log_listener = logging.handlers.QueueListener(log_queue, *handlers)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
+
+def _try_stat(path: str) -> Optional[os.stat_result]:
+    """stat() a path, returning None instead of raising if it doesn't exist."""
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+
+class _TokenBucket:
+    """
+    Token-bucket limiter for upload starts.
+    
+    Holds up to ``capacity`` tokens and starts full; a daemon thread adds one
+    token every ``60 / per_minute`` seconds. ``acquire()`` blocks until a
+    token is available.
+    """
+    
+    def __init__(self, per_minute: int, capacity: int):
+        self._tokens = threading.BoundedSemaphore(capacity)
+        self._interval = 60.0 / per_minute
+        self._stopped = threading.Event()
+        self._refiller = threading.Thread(
+            target=self._refill, name='upload-rate-limiter', daemon=True
+        )
+        self._refiller.start()
+    
+    def _refill(self):
+        while not self._stopped.wait(self._interval):
+            try:
+                self._tokens.release()
+            except ValueError:
+                pass  # Bucket already full
+    
+    def acquire(self):
+        """Block until an upload may start."""
+        self._tokens.acquire()
+    
+    def stop(self):
+        """Stop the refill thread."""
+        self._stopped.set()
+
+
+class _BloomFilter:
+    """
+    Bloom filter over names (blake2b double hashing, bits in a bytearray).
+    
+    Items may be given as str or as their UTF-8 encoding; both hash alike.
+    
+    Membership tests may return false positives (at roughly ``error_rate``
+    while at most ``capacity`` items are added) but never false negatives.
+    """
+    
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        self._num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self._num_hashes = max(1, round(self._num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self._num_bits + 7) // 8)
+    
+    def _positions(self, item):
+        if isinstance(item, str):
+            item = item.encode('utf-8')
+        digest = hashlib.blake2b(item, digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self._num_hashes):
+            yield (h1 + i * h2) % self._num_bits
+    
+    def add(self, item):
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+    
+    def __contains__(self, item) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
 
 
 class VideoUploadManager:
@@ -41,18 +146,70 @@ class VideoUploadManager:
         self.config = self._load_config(config_path)
         self.video_processor = VideoProcessor(self.config)
         self.filename_parser = FilenameParser(self.config)
+        self.metadata_cache = MetadataCache(
+            os.path.join(self.config.get_full_temp_path(), 'meta.db'),
+            self.filename_parser,
+            self.video_processor
+        )
+        # ffprobe output is cached in the same database
+        self.video_processor.probe_cache = self.metadata_cache
         
-        # Initialize uploaders
-        self.youtube_uploader = YouTubeUploader(self.config)
+        # Initialize uploaders. Imported here rather than at module level so
+        # main() can bootstrap a config file without loading the uploader stack.
+        # The API client is not thread-safe, so each upload worker gets its
+        # own YouTubeUploader (see youtube_uploader)
+        from youtube_uploader import YouTubeUploader, FallbackUploader, GOOGLE_APIS_AVAILABLE
+        self._youtube_uploader_class = YouTubeUploader
+        self._google_apis_available = GOOGLE_APIS_AVAILABLE
+        self._thread_local = threading.local()
         self.fallback_uploader = FallbackUploader(self.config)
         
-        self._uploaded_files = set()
+        # Guards _uploaded_bloom, the upload log and the run statistics
+        self._lock = threading.Lock()
+        self._rate_limiter: Optional[_TokenBucket] = None
+        
+        self._uploaded_bloom = _BloomFilter(1 << 16)
         self._load_uploaded_files()
+        
+        # Kept open for the manager's lifetime; each batch is one buffered
+        # write plus a flush instead of an open/append/close cycle
+        self._log_fp = open(self.config.get_full_log_path(), 'a',
+                            encoding='utf-8', buffering=1 << 16)
+        atexit.register(self.close)
+    
+    def __enter__(self) -> 'VideoUploadManager':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Close the upload log and flush the metadata cache."""
+        with self._lock:
+            if not self._log_fp.closed:
+                self._log_fp.close()
+        self.metadata_cache.close()
+        atexit.unregister(self.close)
+    
+    @property
+    def youtube_uploader(self) -> 'YouTubeUploader':
+        """The calling thread's YouTube API uploader."""
+        uploader = getattr(self._thread_local, 'youtube_uploader', None)
+        if uploader is None:
+            uploader = self._youtube_uploader_class(self.config)
+            self._thread_local.youtube_uploader = uploader
+        return uploader
+    
+    def _wait_for_upload_slot(self):
+        """Block until the rate limiter allows another upload to start."""
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire()
     
     def _load_config(self, config_path: Optional[str]) -> VideoConfig:
         """Load configuration from file or environment."""
-        if config_path and os.path.exists(config_path):
-            config = VideoConfig.from_file(config_path)
+        st = _try_stat(config_path) if config_path else None
+        if st is not None:
+            config = VideoConfig.from_file(config_path, mtime=st.st_mtime)
         else:
             config = VideoConfig.from_env()
         
@@ -68,27 +225,79 @@ class VideoUploadManager:
     
     
     def _load_uploaded_files(self):
-        """Load list of already uploaded files."""
+        """
+        Load list of already uploaded files.
+        
+        Only a Bloom filter of the names is kept in memory; names it reports
+        as present are confirmed against the log (see _confirm_uploaded).
+        """
         log_path = self.config.get_full_log_path()
-        if os.path.exists(log_path):
+        st = _try_stat(log_path)
+        if st is not None and st.st_size > 0:
             try:
-                with open(log_path, "r", encoding='utf-8') as f:
-                    self._uploaded_files = set(line.strip() for line in f if line.strip())
-                logger.info(f"Loaded {len(self._uploaded_files)} previously uploaded files")
-            except IOError as e:
+                # Sized from the file so the names need not be counted (or
+                # kept) first; every valid name is well over 16 bytes long
+                bloom = _BloomFilter(max(1 << 16, st.st_size // 16))
+                count = 0
+                for name in self._iter_log_names(log_path):
+                    bloom.add(name)
+                    count += 1
+                self._uploaded_bloom = bloom
+                logger.info(f"Loaded {count} previously uploaded files")
+            except (IOError, ValueError) as e:
                 logger.warning(f"Failed to load uploaded files log: {e}")
     
-    def _mark_as_uploaded(self, filenames: List[str]):
+    @staticmethod
+    def _iter_log_names(log_path: str) -> Iterator[bytes]:
+        """
+        Yield the non-empty lines of the upload log as raw UTF-8 bytes.
+        
+        The file is mapped and read one line at a time, so neither per-line
+        str objects nor a list of every line are built.
+        """
+        with open(log_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for line in iter(mm.readline, b""):
+                    name = line.strip()
+                    if name:
+                        yield name
+    
+    def _confirm_uploaded(self, candidates: set) -> set:
+        """
+        Return the subset of ``candidates`` really listed in the upload log,
+        weeding out Bloom filter false positives in one pass over the log.
+        """
+        if not candidates:
+            return set()
+        
+        encoded = {name.encode('utf-8'): name for name in candidates}
+        with self._lock:
+            try:
+                return {encoded[name]
+                        for name in self._iter_log_names(self.config.get_full_log_path())
+                        if name in encoded}
+            except (IOError, ValueError) as e:
+                # Can't verify; treat everything as uploaded rather than
+                # risk uploading twice
+                logger.warning(f"Failed to read uploaded files log: {e}")
+                return set(candidates)
+    
+    def _mark_as_uploaded(self, videos: List[VideoEntry]):
         """Mark files as uploaded in the log."""
-        log_path = self.config.get_full_log_path()
-        try:
-            with open(log_path, "a", encoding='utf-8') as f:
-                for filename in filenames:
-                    f.write(f"{filename}\n")
-                    self._uploaded_files.add(filename)
-            logger.debug(f"Marked {len(filenames)} files as uploaded")
-        except IOError as e:
-            logger.error(f"Failed to update uploaded files log: {e}")
+        with self._lock:
+            for video in videos:
+                self._uploaded_bloom.add(video.name)
+            try:
+                self._log_fp.writelines(f"{video.name}\n" for video in videos)
+                self._log_fp.flush()
+                # The videos are already on YouTube; losing this record to a
+                # power cut would upload them again on the next run
+                os.fsync(self._log_fp.fileno())
+                logger.debug(f"Marked {len(videos)} files as uploaded")
+            except IOError as e:
+                logger.error(f"Failed to update uploaded files log: {e}")
     
     def _safe_delete_file(self, file_path: str):
         """Safely delete a file with error handling."""
@@ -102,22 +311,56 @@ class VideoUploadManager:
         except OSError as e:
             logger.error(f"Failed to delete {file_path}: {e}")
     
-    def _get_pending_videos(self) -> Dict:
-        """Get videos that haven't been uploaded yet, grouped by date."""
-        videos_by_date = defaultdict(list)
+    def _get_pending_videos(self) -> Dict[str, Tuple[date, str, List[VideoEntry]]]:
+        """
+        Get videos that haven't been uploaded yet, grouped by date.
         
-        if not os.path.exists(self.config.video_dir):
+        Returns:
+            Mapping of ISO date string to (date, 'DD-MM-YYYY' label, videos);
+            the label used in merged titles and filenames is formatted once
+            per group
+        """
+        videos_by_date = {}
+        
+        try:
+            entries = os.scandir(self.config.video_dir)
+        except FileNotFoundError:
             logger.error(f"Video directory does not exist: {self.config.video_dir}")
             return videos_by_date
         
-        for filename in os.listdir(self.config.video_dir):
-            if not filename.endswith(".mp4") or filename in self._uploaded_files:
+        # scandir yields the file type from the directory listing itself, so
+        # filtering needs no extra stat calls or path joins
+        candidates = []
+        maybe_uploaded = set()
+        with entries:
+            for entry in entries:
+                filename = entry.name
+                if (not filename.endswith(".mp4")
+                        or not entry.is_file(follow_symlinks=False)):
+                    continue
+                if filename in self._uploaded_bloom:
+                    maybe_uploaded.add(filename)
+                candidates.append(entry)
+        
+        uploaded = self._confirm_uploaded(maybe_uploaded)
+        
+        for entry in candidates:
+            filename = entry.name
+            if filename in uploaded:
+                continue
+            
+            match = FilenameParser.FILENAME_RE.match(filename)
+            if match is None:
+                logger.warning(f"Skipping {filename}: filename does not match the expected format")
                 continue
             
             try:
-                video_date = self.filename_parser.get_video_date(filename)
-                full_path = os.path.join(self.config.video_dir, filename)
-                videos_by_date[video_date].append(full_path)
+                video_date = self.filename_parser.get_match_date(match)
+                group = videos_by_date.get(video_date.isoformat())
+                if group is None:
+                    date_str = f"{video_date.day:02d}-{video_date.month:02d}-{video_date.year:04d}"
+                    group = videos_by_date[video_date.isoformat()] = (video_date, date_str, [])
+                group[2].append(VideoEntry.from_dir_entry(entry))
             except InvalidFilenameError as e:
                 logger.warning(f"Skipping {filename}: {e}")
                 continue
@@ -125,30 +368,33 @@ class VideoUploadManager:
                 logger.error(f"Unexpected error processing {filename}: {e}")
                 continue
         
-        logger.info(f"Found {sum(len(videos) for videos in videos_by_date.values())} pending videos across {len(videos_by_date)} dates")
+        logger.info(f"Found {sum(len(videos) for _, _, videos in videos_by_date.values())} pending videos across {len(videos_by_date)} dates")
         return videos_by_date
     
-    def _upload_single_video(self, file_path: str) -> bool:
+    def _upload_single_video(self, video: VideoEntry) -> bool:
         """
         Upload a single video file.
         
         Args:
-            file_path: Path to video file
+            video: Video to upload
             
         Returns:
             True if upload successful
         """
-        filename = os.path.basename(file_path)
+        filename = video.name
+        file_path = video.path
         
         try:
             title = self.filename_parser.parse_title(filename)
             logger.info(f"Uploading single video: {filename} with title: {title}")
             
+            self._wait_for_upload_slot()
+            
             # Try YouTube API first, fallback to youtube-upload tool
             video_id = self.youtube_uploader.upload_video(file_path, title)
             
             if video_id:
-                self._mark_as_uploaded([filename])
+                self._mark_as_uploaded([video])
                 logger.info(f"Successfully uploaded: {filename} (ID: {video_id})")
                 self._safe_delete_file(file_path)
                 return True
@@ -156,7 +402,7 @@ class VideoUploadManager:
                 # Fallback to external tool
                 logger.info("Falling back to external youtube-upload tool")
                 if self.fallback_uploader.upload_video(file_path, title):
-                    self._mark_as_uploaded([filename])
+                    self._mark_as_uploaded([video])
                     logger.info(f"Successfully uploaded using fallback: {filename}")
                     self._safe_delete_file(file_path)
                     return True
@@ -168,41 +414,65 @@ class VideoUploadManager:
             logger.error(f"Error uploading {filename}: {e}")
             return False
     
-    def _upload_merged_video(self, video_files: List[str], date) -> bool:
+    def _upload_merged_video(self, video_files: List[VideoEntry], day: date, date_str: str) -> bool:
         """
         Merge multiple videos and upload as single video.
         
         Args:
-            video_files: List of video file paths
-            date: Date for the video collection
+            video_files: Videos recorded on that date
+            day: Date for the video collection
+            date_str: The date formatted as DD-MM-YYYY
             
         Returns:
             True if upload successful
         """
-        merged_filename = f"{date.strftime('%d-%m-%Y')}_rudikiaz_arenas.mp4"
-        merged_path = os.path.join(self.config.temp_dir, merged_filename)
+        merged_filename = f"{date_str}_rudikiaz_arenas.mp4"
+        merged_path = os.path.join(self.config.get_full_temp_path(), merged_filename)
         
         try:
-            logger.info(f"Merging {len(video_files)} videos for date {date}")
+            logger.info(f"Merging {len(video_files)} videos for date {day}")
             
-            # Sort files by datetime for correct order
-            sorted_files = sorted(
-                video_files, 
-                key=lambda fp: self.filename_parser.get_video_datetime(os.path.basename(fp))
-            )
-            
-            # Merge videos
-            if not self.video_processor.merge_videos(sorted_files, merged_path, overwrite=True):
-                logger.error(f"Failed to merge videos for date {date}")
-                return False
+            # Sort files by datetime for correct order; keys are computed once
+            # per file (index breaks ties, VideoEntry itself isn't orderable)
+            decorated = [
+                (self.metadata_cache.get_video_datetime(video), i, video)
+                for i, video in enumerate(video_files)
+            ]
+            decorated.sort()
+            sorted_files = [video for _, _, video in decorated]
             
             # Create description with timestamps
-            title = self.config.merged_video_title_template.format(date=date.strftime('%d-%m-%Y'))
+            title = self.config.merged_video_title_template.format(date=date_str)
             description = self._create_merged_description(sorted_files)
             
             logger.info(f"Uploading merged video: {merged_filename}")
             logger.debug(f"Description:\n{description}")
             
+            self._wait_for_upload_slot()
+            
+            # Stream the merge straight into the upload; nothing is written
+            # to disk unless this fails and we fall back to merge-then-upload
+            sorted_paths = [video.path for video in sorted_files]
+            if self._upload_merged_stream(sorted_paths, merged_filename, title, description):
+                self._mark_as_uploaded(video_files)
+                for video in video_files:
+                    self._safe_delete_file(video.path)
+                return True
+            
+            # Merge videos; clips whose streams differ (e.g. a changed
+            # resolution or frame rate) cannot be stream-copied, so they are
+            # re-encoded instead
+            try:
+                merged = self.video_processor.merge_videos(sorted_paths, merged_path, overwrite=True)
+            except IncompatibleVideosError as e:
+                logger.warning(f"{e}; re-encoding instead")
+                merged = self.video_processor.merge_and_compress(
+                    sorted_paths, merged_path, copy_if_compatible=False
+                )
+            if not merged:
+                logger.error(f"Failed to merge videos for date {day}")
+                return False
+            
             # Try YouTube API first
             video_id = self.youtube_uploader.upload_video(
                 merged_path, title, description
@@ -221,13 +491,12 @@ class VideoUploadManager:
             
             if upload_success:
                 # Mark individual files as uploaded
-                filenames = [os.path.basename(fp) for fp in video_files]
-                self._mark_as_uploaded(filenames)
+                self._mark_as_uploaded(video_files)
                 
                 # Clean up files
                 self._safe_delete_file(merged_path)
-                for file_path in video_files:
-                    self._safe_delete_file(file_path)
+                for video in video_files:
+                    self._safe_delete_file(video.path)
                 
                 return True
             else:
@@ -235,34 +504,99 @@ class VideoUploadManager:
                 return False
                 
         except Exception as e:
-            logger.error(f"Error processing merged video for date {date}: {e}")
+            logger.error(f"Error processing merged video for date {day}: {e}")
+            return False
+    
+    def _upload_merged_stream(self, sorted_files: List[str], merged_filename: str,
+                              title: str, description: str) -> bool:
+        """
+        Merge and upload in one pass, piping FFmpeg's output into the upload.
+        
+        FFmpeg's exit status is checked before the final chunk is sent, so a
+        merge that dies partway aborts the upload instead of publishing a
+        truncated video.
+        
+        Returns:
+            True if upload successful; False if the caller should fall back
+            to the two-phase merge-then-upload path
+        """
+        if not self._google_apis_available:
+            return False
+        
+        name = os.path.splitext(merged_filename)[0]
+        video_id = None
+        try:
+            with self.video_processor.start_merge_stream(sorted_files, name) as stream:
+                video_id = self.youtube_uploader.upload_stream(
+                    stream.stdout, title, description, on_eof=stream.wait
+                )
+        except Exception as e:
+            if video_id:
+                # Already published; uploading again would only duplicate it
+                logger.warning(f"Cleaning up the streaming merge for {merged_filename} failed: {e}")
+            else:
+                logger.warning(f"Streaming upload failed for {merged_filename}, falling back to merge-then-upload: {e}")
+                return False
+        
+        if not video_id:
+            logger.warning(f"Streaming upload failed for {merged_filename}, falling back to merge-then-upload")
             return False
+        
+        logger.info(f"Successfully uploaded merged video: {merged_filename} (ID: {video_id})")
+        return True
     
-    def _create_merged_description(self, sorted_files: List[str]) -> str:
+    def _create_merged_description(self, sorted_files: List[VideoEntry]) -> str:
         """Create description with timestamps for merged video."""
+        # One batched lookup probes every uncached clip in parallel; the
+        # offsets are then a prefix sum. A clip whose duration fails does not
+        # advance the offset.
+        durations = self.metadata_cache.get_video_durations(sorted_files)
+        
         description_lines = []
         offset = 0.0
         
-        for file_path in sorted_files:
+        for video in sorted_files:
             try:
-                formatted_offset = self.video_processor.format_time(offset)
-                clip_desc = self.filename_parser.extract_clip_description(
-                    os.path.basename(file_path)
-                )
-                description_lines.append(f"{formatted_offset}  {clip_desc}")
-                
-                duration = self.video_processor.get_video_duration(file_path)
-                offset += duration
+                clip_desc = self.metadata_cache.extract_clip_description(video)
             except Exception as e:
-                logger.warning(f"Error processing clip description for {file_path}: {e}")
+                # Leave the clip out of the description
+                logger.warning(f"Error processing clip description for {video.path}: {e}")
                 continue
+            
+            formatted_offset = self.video_processor.format_time(offset)
+            description_lines.append(f"{formatted_offset}  {clip_desc}")
+            offset += durations.get(video.path, 0.0)
         
         return "\n".join(description_lines)
     
+    def _handle_date(self, day: date, date_str: str, video_files: List[VideoEntry],
+                     stats: Dict[str, int]):
+        """Upload one date's videos (single or merged) and record the outcome."""
+        if len(video_files) == 1:
+            # Single video upload
+            success = self._upload_single_video(video_files[0])
+        else:
+            # Multiple videos - merge and upload
+            success = self._upload_merged_video(video_files, day, date_str)
+        
+        with self._lock:
+            stats['total_processed'] += len(video_files)
+            if success:
+                stats['successful_uploads'] += len(video_files)
+                if len(video_files) == 1:
+                    stats['single_videos'] += 1
+                else:
+                    stats['merged_videos'] += 1
+            else:
+                stats['failed_uploads'] += len(video_files)
+    
     def process_videos(self) -> Dict[str, int]:
         """
         Process all pending videos.
         
+        Dates are handled in parallel by up to ``config.concurrency`` workers;
+        upload starts are throttled to ``config.uploads_per_minute``.
+        
         Returns:
             Dictionary with processing statistics
         """
@@ -275,35 +609,23 @@ class VideoUploadManager:
         }
         
         try:
-            # Ensure temp directory exists
-            os.makedirs(self.config.temp_dir, exist_ok=True)
-            
             videos_by_date = self._get_pending_videos()
             
             if not videos_by_date:
                 logger.info("No pending videos to process")
                 return stats
             
-            for date, video_files in videos_by_date.items():
-                stats['total_processed'] += len(video_files)
-                
-                if len(video_files) == 1:
-                    # Single video upload
-                    if self._upload_single_video(video_files[0]):
-                        stats['successful_uploads'] += 1
-                        stats['single_videos'] += 1
-                    else:
-                        stats['failed_uploads'] += 1
-                else:
-                    # Multiple videos - merge and upload
-                    if self._upload_merged_video(video_files, date):
-                        stats['successful_uploads'] += len(video_files)
-                        stats['merged_videos'] += 1
-                    else:
-                        stats['failed_uploads'] += len(video_files)
-                
-                # Add delay between uploads to avoid rate limiting
-                time.sleep(2)
+            self._rate_limiter = _TokenBucket(
+                self.config.uploads_per_minute, self.config.concurrency
+            )
+            with ThreadPoolExecutor(max_workers=self.config.concurrency,
+                                    thread_name_prefix='upload') as executor:
+                futures = [
+                    executor.submit(self._handle_date, day, date_str, video_files, stats)
+                    for day, date_str, video_files in videos_by_date.values()
+                ]
+                for future in futures:
+                    future.result()
             
             logger.info(f"Processing complete. Stats: {stats}")
             return stats
@@ -311,22 +633,29 @@ class VideoUploadManager:
         except Exception as e:
             logger.error(f"Unexpected error during video processing: {e}")
             raise
+        finally:
+            if self._rate_limiter is not None:
+                self._rate_limiter.stop()
+                self._rate_limiter = None
+            # Persist parsed metadata and durations for the next run
+            self.metadata_cache.flush()
 
 
 def main():
     """Main entry point."""
+    setup_logging()
     try:
         # Create default config if it doesn't exist
         config_file = "config.json"
-        if not os.path.exists(config_file):
+        if _try_stat(config_file) is None:
             logger.info("Creating default configuration file")
             create_default_config(config_file)
             logger.info(f"Please edit {config_file} with your settings and run again")
             return
         
         # Initialize and run uploader
-        uploader = VideoUploadManager(config_file)
-        stats = uploader.process_videos()
+        with VideoUploadManager(config_file) as uploader:
+            stats = uploader.process_videos()
         
         logger.info("Video upload process completed successfully")
         logger.info(f"Final statistics: {stats}")
@@ -0,0 +1,9 @@
+"""
+PyInstaller runtime hook.
+
+The frozen executable already carries compiled bytecode, so skip any attempt
+to write __pycache__ next to the (possibly read-only) install directory.
+"""
+import sys
+
+sys.dont_write_bytecode = True
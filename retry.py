@@ -0,0 +1,65 @@
+"""
+Retry helper with exponential backoff and random ("full") jitter.
+"""
+import time
+import random
+import logging
+import functools
+from typing import Callable, Optional, Tuple, Type
+
+
+logger = logging.getLogger(__name__)
+
+# Upper bound for the exponential part of a backoff delay (seconds)
+MAX_BACKOFF = 60
+
+
+def backoff_delay(attempt: int, base: float, cap: float = MAX_BACKOFF) -> float:
+    """
+    Get the delay before retry number ``attempt + 1``.
+    
+    Args:
+        attempt: Zero-based index of the attempt that just failed
+        base: Delay after the first failure, in seconds
+        cap: Maximum for the exponential part
+    
+    Returns:
+        A uniformly random delay between 0 and ``min(base * 2**attempt, cap)``
+        (full jitter: concurrent clients that failed together spread their
+        retries out instead of hitting the server again in lockstep)
+    """
+    return random.uniform(0, min(base * 2 ** attempt, cap))
+
+
+def retry_with_backoff(max_retries: int, base: float,
+                       retry_on: Tuple[Type[BaseException], ...] = (Exception,),
+                       should_retry: Optional[Callable[[BaseException], bool]] = None):
+    """
+    Decorator retrying a call with exponential backoff and jitter.
+    
+    Only exceptions listed in ``retry_on`` (and accepted by ``should_retry``,
+    if given) trigger a retry; anything else propagates immediately. When all
+    attempts fail the last exception is re-raised.
+    
+    Args:
+        max_retries: Total number of attempts (at least one is always made)
+        base: Delay after the first failure, in seconds (see backoff_delay)
+        retry_on: Exception types that may be retried
+        should_retry: Optional predicate for finer-grained decisions
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            attempts = max(1, max_retries)
+            for attempt in range(attempts):
+                try:
+                    return func(*args, **kwargs)
+                except retry_on as e:
+                    if attempt == attempts - 1 or (should_retry and not should_retry(e)):
+                        raise
+                    delay = backoff_delay(attempt, base)
+                    logger.warning(f"Attempt {attempt + 1}/{attempts} of {func.__name__} failed: {e}; "
+                                   f"retrying in {delay:.1f}s")
+                    time.sleep(delay)
+        return wrapper
+    return decorator
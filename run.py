@@ -1,20 +1,10 @@
 #!/usr/bin/env python3
 """
 Simple run script for the Enhanced Video Uploader.
-"""
-import sys
-import os
 
-# Add current directory to Python path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+main() logs fatal errors itself, so nothing is wrapped here; heavy modules
+are only imported once there is actually work to do.
+"""
+from main import main
 
-try:
-    from main import main
-    main()
-except ImportError as e:
-    print(f"Import error: {e}")
-    print("Make sure all dependencies are installed: pip install -r requirements.txt")
-    sys.exit(1)
-except Exception as e:
-    print(f"Error: {e}")
-    sys.exit(1)
+main()
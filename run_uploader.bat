@@ -1,7 +1,7 @@
 @echo off
 echo Starting YouTube Video Uploader...
 echo.
-youtube_uploader.exe
+youtube_uploader\youtube_uploader.exe
 echo.
 echo Upload process completed.
 pause
@@ -3,10 +3,12 @@ Setup and installation script for the Enhanced Video Uploader.
 """
 import os
 import sys
+import shutil
 import subprocess
-import json
 from pathlib import Path
 
+from config import DEFAULT_CONFIG, json_dumps
+
 
 def check_python_version():
     """Check if Python version is compatible."""
@@ -21,10 +23,17 @@ def install_requirements():
     """Install required Python packages."""
     print("📦 Installing Python packages...")
     
+    # uv resolves and downloads in parallel, which is much faster than pip
+    uv_path = shutil.which('uv')
+    if uv_path:
+        print("⚡ Using uv to install requirements")
+        command = [uv_path, "pip", "install", "--python", sys.executable, "-r", "requirements.txt"]
+    else:
+        print("🐍 Using pip to install requirements (install uv for faster setup)")
+        command = [sys.executable, "-m", "pip", "install", "-r", "requirements.txt"]
+    
     try:
-        subprocess.check_call([
-            sys.executable, "-m", "pip", "install", "-r", "requirements.txt"
-        ])
+        subprocess.check_call(command)
         print("✅ Requirements installed successfully")
         return True
     except subprocess.CalledProcessError as e:
@@ -33,25 +42,48 @@ def install_requirements():
 
 
 def check_ffmpeg():
-    """Check if FFmpeg is available."""
+    """
+    Check if FFmpeg is available.
+    
+    Returns:
+        Config settings for the detected FFmpeg (resolved ffmpeg/ffprobe
+        paths and ffmpeg version), or None if FFmpeg is unavailable
+    """
     print("🔍 Checking FFmpeg...")
     
     try:
-        result = subprocess.run(['ffmpeg', '-version'], capture_output=True, timeout=10)
+        result = subprocess.run(['ffmpeg', '-version'], capture_output=True, text=True, timeout=10)
         if result.returncode == 0:
-            print("✅ FFmpeg is available")
-            return True
+            # First line reads "ffmpeg version <version> Copyright ..."
+            words = result.stdout.split(maxsplit=3)
+            version = words[2] if len(words) > 2 else "unknown"
+            print(f"✅ FFmpeg is available (version {version})")
+            
+            ffmpeg_info = {
+                "ffmpeg_path": shutil.which('ffmpeg'),
+                "ffmpeg_version": version
+            }
+            ffprobe_path = shutil.which('ffprobe')
+            if ffprobe_path:
+                ffmpeg_info["ffprobe_path"] = ffprobe_path
+            return ffmpeg_info
         else:
             print("❌ FFmpeg check failed")
-            return False
+            return None
     except (FileNotFoundError, subprocess.TimeoutExpired):
         print("❌ FFmpeg not found")
         print("Please install FFmpeg from: https://ffmpeg.org/download.html")
-        return False
+        return None
 
 
-def create_config():
-    """Create default configuration file."""
+def create_config(ffmpeg_info=None):
+    """
+    Create default configuration file.
+    
+    Args:
+        ffmpeg_info: Settings from check_ffmpeg() to record, so the uploader
+            can skip probing FFmpeg at startup
+    """
     config_file = "config.json"
     
     if os.path.exists(config_file):
@@ -61,35 +93,18 @@ def create_config():
     print(f"🔧 Creating default configuration: {config_file}")
     
     # Get user input for key settings
-    video_dir = input("Enter video directory path [d:/VIDEOS/recorder]: ").strip()
+    default_video_dir = DEFAULT_CONFIG["video_dir"]
+    video_dir = input(f"Enter video directory path [{default_video_dir}]: ").strip()
     if not video_dir:
-        video_dir = "d:/VIDEOS/recorder"
-    
-    config = {
-        "video_dir": video_dir,
-        "log_file": "uploaded.txt",
-        "temp_dir": "temp_merged",
-        "ffmpeg_path": "./ffmpeg.exe",
-        "ffprobe_path": "./ffprobe.exe",
-        "youtube_client_secrets": "client_secrets.json",
-        "youtube_credentials": "youtube_credentials.json",
-        "youtube_scopes": ["https://www.googleapis.com/auth/youtube.upload"],
-        "early_morning_cutoff": 4,
-        "max_file_size_gb": 2.0,
-        "video_quality": "720p",
-        "default_privacy": "private",
-        "default_category": "20",
-        "default_tags": ["gaming", "arena", "pvp"],
-        "merged_video_title_template": "Rudikiaz arenas for {date}",
-        "individual_video_title_template": "{username} {activity}",
-        "max_retries": 3,
-        "retry_delay": 5,
-        "delete_after_upload": True
-    }
+        video_dir = default_video_dir
+    
+    config = dict(DEFAULT_CONFIG, video_dir=video_dir)
+    if ffmpeg_info:
+        config.update(ffmpeg_info)
     
     try:
         with open(config_file, 'w') as f:
-            json.dump(config, f, indent=2)
+            f.write(json_dumps(config))
         print(f"✅ Created {config_file}")
         return True
     except Exception as e:
@@ -188,10 +203,11 @@ def main():
         return False
     
     # Check FFmpeg
-    ffmpeg_ok = check_ffmpeg()
+    ffmpeg_info = check_ffmpeg()
+    ffmpeg_ok = ffmpeg_info is not None
     
     # Create configuration
-    config_ok = create_config()
+    config_ok = create_config(ffmpeg_info)
     
     # Check YouTube credentials
     youtube_ok = check_youtube_credentials()
@@ -34,6 +34,12 @@ try:
 except Exception as e:
     print(f'❌ exceptions import error: {e}')
 
+try:
+    import retry
+    print('✅ retry import works')
+except Exception as e:
+    print(f'❌ retry import error: {e}')
+
 try:
     import video_processor
     print('✅ video_processor import works')
@@ -2,34 +2,167 @@
 Video processing utilities for merging and manipulating video files.
 """
 import os
+import re
+import json
+import functools
+import struct
+import sqlite3
 import subprocess
 import logging
+import threading
+import collections
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
-from datetime import datetime, timedelta
+from typing import Callable, Dict, List, NamedTuple, Optional
+from datetime import date, datetime, timedelta
+from dataclasses import dataclass
 
-from config import VideoConfig
-from exceptions import FFmpegError, VideoProcessingError, InvalidFilenameError
+from config import VideoConfig, json_loads
+from exceptions import (
+    FFmpegError, VideoProcessingError, IncompatibleVideosError, InvalidFilenameError
+)
 
 
 logger = logging.getLogger(__name__)
 
 
+def _find_box(f, box_type: bytes, start: int, end: int) -> Optional[tuple]:
+    """
+    Find an MP4 box among the siblings in ``[start, end)`` of an open file.
+    
+    Returns:
+        (payload_start, box_end) of the first box of ``box_type``, or None
+    """
+    pos = start
+    while pos + 8 <= end:
+        f.seek(pos)
+        header = f.read(8)
+        if len(header) < 8:
+            return None
+        size, kind = struct.unpack('>I4s', header)
+        header_size = 8
+        if size == 1:
+            # 64-bit "largesize" follows the type
+            large = f.read(8)
+            if len(large) < 8:
+                return None
+            size = struct.unpack('>Q', large)[0]
+            header_size = 16
+        elif size == 0:
+            # Box extends to the end of its parent
+            size = end - pos
+        if size < header_size:
+            return None
+        if kind == box_type:
+            return pos + header_size, pos + size
+        pos += size
+    return None
+
+
+def fast_duration(path: str) -> Optional[float]:
+    """
+    Read an MP4's duration straight from its moov/mvhd box.
+    
+    Only box headers are read while walking to moov (wherever it sits in the
+    file), so this costs a handful of small reads instead of an ffprobe run.
+    
+    Args:
+        path: Path to an MP4 file
+        
+    Returns:
+        Duration in seconds, or None if the file could not be parsed (callers
+        should fall back to ffprobe)
+    """
+    try:
+        with open(path, 'rb') as f:
+            file_size = os.fstat(f.fileno()).st_size
+            moov = _find_box(f, b'moov', 0, file_size)
+            if moov is None:
+                return None
+            mvhd = _find_box(f, b'mvhd', *moov)
+            if mvhd is None:
+                return None
+            
+            f.seek(mvhd[0])
+            data = f.read(32)
+            if len(data) < 4:
+                return None
+            if data[0] == 1:
+                # version 1: 64-bit creation/modification times and duration
+                if len(data) < 32:
+                    return None
+                timescale, duration = struct.unpack_from('>IQ', data, 20)
+            else:
+                if len(data) < 20:
+                    return None
+                timescale, duration = struct.unpack_from('>II', data, 12)
+    except OSError:
+        return None
+    
+    # Fragmented files have no duration in mvhd
+    if not timescale or not duration:
+        return None
+    return duration / timescale
+
+
+def _map_threaded(func, items: list, max_workers: int) -> list:
+    """``list(map(func, items))`` run on a thread pool when there is more than one item."""
+    if len(items) <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(func, items))
+
+
+# How much of each merge input to ask the kernel to read ahead (see _prefetch)
+_PREFETCH_BYTES = 16 * 1024 * 1024
+
+
+def _prefetch_file(path: str):
+    """Issue POSIX_FADV_WILLNEED for the head of one file (see _prefetch)."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, _PREFETCH_BYTES, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _prefetch(paths: List[str]):
+    """
+    Ask the kernel to start reading the head of each file into the page
+    cache (POSIX_FADV_WILLNEED), so FFmpeg's first reads of every input hit
+    cache while it is still copying earlier ones.
+    
+    The files are opened concurrently, since on network shares each open is
+    a round-trip. POSIX_FADV_SEQUENTIAL is not used: it only applies to the
+    descriptor it is issued on, not to the one FFmpeg opens. A no-op where
+    posix_fadvise is unavailable (Windows).
+    """
+    if hasattr(os, 'posix_fadvise'):
+        _map_threaded(_prefetch_file, paths, 32)
+
+
+# Worker count for concurrent ffprobe runs (I/O- and process-bound)
+_PROBE_WORKERS = min(16, (os.cpu_count() or 1) * 2)
+
+
 class VideoProcessor:
     """Handles video processing operations like merging and format conversion."""
     
     def __init__(self, config: VideoConfig):
         self.config = config
-        self._ensure_temp_dir()
-    
-    def _ensure_temp_dir(self) -> None:
-        """Ensure temporary directory exists."""
-        temp_path = self.config.get_full_temp_path()
-        os.makedirs(temp_path, exist_ok=True)
+        # Optional store for ffprobe output with get_probe/put_probe methods
+        # (a MetadataCache); None disables caching
+        self.probe_cache: Optional['MetadataCache'] = None
     
     def get_video_duration(self, file_path: str) -> float:
         """
-        Get video duration in seconds using ffprobe.
+        Get video duration in seconds, read from the MP4 header when possible
+        and via ffprobe otherwise.
         
         Args:
             file_path: Path to video file
@@ -40,52 +173,155 @@ class VideoProcessor:
         Raises:
             FFmpegError: If ffprobe fails
         """
-        cmd = [
-            self.config.ffprobe_path,
-            "-v", "error",
-            "-select_streams", "v:0",
-            "-show_entries", "format=duration",
-            "-of", "default=noprint_wrappers=1:nokey=1",
-            file_path
-        ]
+        duration = fast_duration(file_path)
+        if duration is not None:
+            logger.debug(f"Duration for {file_path}: {duration}s (mvhd)")
+            return duration
         
+        # Shares the cached ffprobe run with get_video_info
+        info = self.get_video_info(file_path)
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            duration = float(result.stdout.strip())
-            logger.debug(f"Duration for {file_path}: {duration}s")
-            return duration
-        except subprocess.CalledProcessError as e:
-            raise FFmpegError(f"Failed to get duration for {file_path}: {e.stderr}")
-        except ValueError as e:
-            raise FFmpegError(f"Invalid duration output for {file_path}: {result.stdout}")
+            duration = float(info["format"]["duration"])
+        except (KeyError, TypeError, ValueError):
+            raise FFmpegError(f"Invalid duration output for {file_path}")
+        
+        logger.debug(f"Duration for {file_path}: {duration}s")
+        return duration
+    
+    def get_video_durations(self, paths: List[str]) -> Dict[str, float]:
+        """
+        Get the durations of several videos at once.
+        
+        Each file is probed as in get_video_duration, concurrently: the work
+        is file reads and waiting on ffprobe, so threads overlap it well.
+        
+        Args:
+            paths: Video file paths
+            
+        Returns:
+            Duration in seconds by path; files that fail are logged and left out
+        """
+        def probe(file_path: str) -> Optional[float]:
+            try:
+                return self.get_video_duration(file_path)
+            except FFmpegError as e:
+                logger.warning(f"Could not get duration for {file_path}: {e}")
+                return None
+        
+        results = _map_threaded(probe, paths, _PROBE_WORKERS)
+        return {file_path: duration for file_path, duration in zip(paths, results)
+                if duration is not None}
     
     def get_video_info(self, file_path: str) -> dict:
         """
         Get comprehensive video information using ffprobe.
         
+        Results are kept in ``probe_cache``, if set, until the file's mtime
+        or size changes.
+        
         Args:
             file_path: Path to video file
             
         Returns:
             Dictionary with video information
+            
+        Raises:
+            FFmpegError: If ffprobe fails
         """
-        cmd = [
-            self.config.ffprobe_path,
-            "-v", "quiet",
-            "-print_format", "json",
-            "-show_format",
-            "-show_streams",
-            file_path
-        ]
+        abs_path = os.path.abspath(file_path)
+        try:
+            st = os.stat(abs_path)
+        except OSError as e:
+            raise FFmpegError(f"Failed to get video info for {file_path}: {e}")
+        
+        cache = self.probe_cache
+        output = cache.get_probe(abs_path, st) if cache is not None else None
+        if output is None:
+            cmd = [
+                self.config.ffprobe_path,
+                "-v", "quiet",
+                "-print_format", "json",
+                "-show_format",
+                "-show_streams",
+                file_path
+            ]
+            
+            try:
+                result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            except subprocess.CalledProcessError as e:
+                raise FFmpegError(f"Failed to get video info for {file_path}: {e.stderr}")
+            output = result.stdout
+            cached = False
+        else:
+            cached = True
         
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            import json
-            return json.loads(result.stdout)
-        except subprocess.CalledProcessError as e:
-            raise FFmpegError(f"Failed to get video info for {file_path}: {e.stderr}")
+            info = json_loads(output)
         except json.JSONDecodeError as e:
             raise FFmpegError(f"Invalid JSON output from ffprobe: {e}")
+        
+        if not cached and cache is not None:
+            cache.put_probe(abs_path, st, output)
+        return info
+    
+    def get_video_infos(self, paths: List[str]) -> Dict[str, dict]:
+        """
+        Get video information for several files at once (ffprobe runs
+        concurrently, sharing get_video_info's cache).
+        
+        Args:
+            paths: Video file paths
+            
+        Returns:
+            Video information by path
+            
+        Raises:
+            FFmpegError: If ffprobe fails for any file
+        """
+        return dict(zip(paths, _map_threaded(self.get_video_info, paths, _PROBE_WORKERS)))
+    
+    @staticmethod
+    def _stream_signature(info: dict) -> tuple:
+        """
+        Parameters that must match for stream-copy concatenation: video codec,
+        dimensions, pixel format and frame rate, audio codec and sample rate.
+        """
+        # First video and first audio stream
+        first = {}
+        for stream in info.get("streams", ()):
+            first.setdefault(stream.get("codec_type"), stream)
+        video = first.get("video", {})
+        audio = first.get("audio", {})
+        return (
+            video.get("codec_name"), video.get("width"), video.get("height"),
+            video.get("pix_fmt"), video.get("r_frame_rate"),
+            audio.get("codec_name"), audio.get("sample_rate")
+        )
+    
+    def _check_compatible(self, file_list: List[str]) -> tuple:
+        """
+        Check that stream-copy concatenation of the files is safe, before any
+        merge I/O starts.
+        
+        Every file must have the same ``_stream_signature`` as the first one.
+        
+        Returns:
+            The files' common stream signature
+            
+        Raises:
+            IncompatibleVideosError: Listing the files that differ from the first
+            FFmpegError: If a file cannot be probed
+        """
+        infos = self.get_video_infos(file_list)
+        signatures = [self._stream_signature(infos[file_path]) for file_path in file_list]
+        offenders = [file_path for file_path, sig in zip(file_list, signatures)
+                     if sig != signatures[0]]
+        if offenders:
+            raise IncompatibleVideosError(
+                f"Videos cannot be stream-copied together with {file_list[0]} "
+                f"(codec/resolution/format differ): {', '.join(offenders)}"
+            )
+        return signatures[0]
     
     def format_time(self, seconds: float) -> str:
         """
@@ -107,8 +343,62 @@ class VideoProcessor:
         else:
             return f"{minutes:02d}:{secs:02d}"
     
+    # "key=value" lines written by -progress
+    _PROGRESS_LINE_RE = re.compile(r'^\w+=\S*$')
+    
+    def _run_ffmpeg(self, cmd: List[str], failure: str,
+                    progress: Optional[Callable[[float], None]] = None):
+        """
+        Run an FFmpeg command, streaming its stderr instead of buffering it all.
+        
+        Only the last lines of stderr are kept, for the error message. The
+        periodic stats line is turned off (it ends in a carriage return, so
+        a long run would arrive as one unbounded line) and only warnings and
+        errors are logged.
+        
+        Args:
+            cmd: FFmpeg command line
+            failure: Error message prefix if FFmpeg fails
+            progress: Optional callback receiving the output position in
+                seconds as FFmpeg reports it
+            
+        Raises:
+            FFmpegError: If FFmpeg cannot be started or exits with an error
+        """
+        options = ["-nostats", "-loglevel", "warning"]
+        if progress is not None:
+            options += ["-progress", "pipe:2"]
+        cmd = cmd[:1] + options + cmd[1:]
+        
+        tail = collections.deque(maxlen=1024)
+        try:
+            process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        except OSError as e:
+            error_msg = f"{failure}: {e}"
+            logger.error(error_msg)
+            raise FFmpegError(error_msg)
+        
+        # stdout is discarded, so draining stderr here cannot deadlock
+        with process.stderr:
+            for raw_line in process.stderr:
+                line = raw_line.decode('utf-8', errors='replace').rstrip()
+                if progress is not None and line.startswith("out_time_ms="):
+                    # Despite the name, the value is in microseconds
+                    try:
+                        progress(int(line[12:]) / 1_000_000)
+                    except ValueError:
+                        pass
+                elif progress is None or not self._PROGRESS_LINE_RE.match(line):
+                    tail.append(line)
+        
+        if process.wait() != 0:
+            error_msg = f"{failure}: " + "\n".join(tail)
+            logger.error(error_msg)
+            raise FFmpegError(error_msg)
+    
     def merge_videos(self, file_list: List[str], output_file: str, 
-                    overwrite: bool = False) -> bool:
+                    overwrite: bool = False,
+                    progress: Optional[Callable[[float], None]] = None) -> bool:
         """
         Merge multiple videos into a single file using FFmpeg.
         
@@ -116,12 +406,15 @@ class VideoProcessor:
             file_list: List of video file paths to merge
             output_file: Output file path
             overwrite: Whether to overwrite existing output file
+            progress: Optional callback receiving the merged position in seconds
             
         Returns:
             True if merge successful, False otherwise
             
         Raises:
             FFmpegError: If merge fails
+            IncompatibleVideosError: If the inputs cannot be stream-copied
+                together (see merge_and_compress)
             VideoProcessingError: If input validation fails
         """
         if not file_list:
@@ -132,29 +425,24 @@ class VideoProcessor:
             return True
         
         # Validate input files
-        for file_path in file_list:
-            if not os.path.exists(file_path):
-                raise VideoProcessingError(f"Input file does not exist: {file_path}")
+        self._check_inputs(file_list)
+        self._check_compatible(file_list)
+        _prefetch(file_list)
         
-        # Create file list for FFmpeg
-        temp_path = self.config.get_full_temp_path()
-        list_file = os.path.join(temp_path, "file_list.txt")
-        try:
-            with open(list_file, "w", encoding='utf-8') as f:
-                for file_path in file_list:
-                    # Properly escape path for FFmpeg
-                    escaped_path = file_path.replace("\\", "/").replace("'", "'\\''")
-                    f.write(f"file '{escaped_path}'\n")
-        except IOError as e:
-            raise VideoProcessingError(f"Failed to create file list: {e}")
+        # Create file list for FFmpeg (one per output so concurrent merges
+        # never share it)
+        output_stem = os.path.splitext(os.path.basename(output_file))[0]
+        list_file = self._write_concat_list(file_list, output_stem)
         
         # FFmpeg command
         cmd = [
             self.config.ffmpeg_path,
+            "-fflags", "+genpts",
             "-f", "concat",
             "-safe", "0",
             "-i", list_file,
-            "-c", "copy"
+            "-c", "copy",
+            "-avoid_negative_ts", "make_zero"
         ]
         
         if overwrite:
@@ -166,13 +454,9 @@ class VideoProcessor:
         logger.debug(f"FFmpeg command: {' '.join(cmd)}")
         
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            self._run_ffmpeg(cmd, "FFmpeg merge failed", progress)
             logger.info(f"Successfully merged videos to {output_file}")
             return True
-        except subprocess.CalledProcessError as e:
-            error_msg = f"FFmpeg merge failed: {e.stderr}"
-            logger.error(error_msg)
-            raise FFmpegError(error_msg)
         finally:
             # Clean up temporary file list
             try:
@@ -180,15 +464,114 @@ class VideoProcessor:
             except OSError:
                 pass
     
+    def _check_inputs(self, file_list: List[str]):
+        """
+        Raise VideoProcessingError naming every missing input file.
+        
+        The existence checks run concurrently, since on network shares each
+        stat is a round-trip.
+        """
+        exists = _map_threaded(os.path.exists, file_list, 32)
+        missing = [file_path for file_path, ok in zip(file_list, exists) if not ok]
+        if len(missing) == 1:
+            raise VideoProcessingError(f"Input file does not exist: {missing[0]}")
+        if missing:
+            raise VideoProcessingError(f"Input files do not exist: {', '.join(missing)}")
+    
+    def _write_concat_list(self, file_list: List[str], name: str) -> str:
+        """
+        Write an FFmpeg concat demuxer list into the temp directory.
+        
+        Args:
+            file_list: Video file paths, in playback order
+            name: Prefix for the list file name
+            
+        Returns:
+            Path of the written list file
+            
+        Raises:
+            VideoProcessingError: If the list cannot be written
+        """
+        list_file = os.path.join(self.config.get_full_temp_path(), f"{name}_file_list.txt")
+        # Properly escape paths for FFmpeg; the whole list is encoded and
+        # written in one go
+        payload = "".join(
+            "file '" + file_path.replace("\\", "/").replace("'", "'\\''") + "'\n"
+            for file_path in file_list
+        ).encode('utf-8')
+        try:
+            with open(list_file, "wb") as f:
+                f.write(payload)
+        except IOError as e:
+            raise VideoProcessingError(f"Failed to create file list: {e}")
+        
+        return list_file
+    
+    def start_merge_stream(self, file_list: List[str], name: str) -> 'MergeStream':
+        """
+        Start merging videos with FFmpeg, streaming the result instead of
+        writing it to disk.
+        
+        The output is fragmented MP4 (moov up front, fragments per keyframe),
+        which can be produced and consumed strictly sequentially.
+        
+        Args:
+            file_list: List of video file paths to merge, in playback order
+            name: Name used for the temporary concat list
+            
+        Returns:
+            Running MergeStream; read the merged video from its ``stdout``
+            
+        Raises:
+            IncompatibleVideosError: If the inputs cannot be stream-copied together
+            VideoProcessingError: If input validation fails
+            FFmpegError: If FFmpeg cannot be started
+        """
+        if not file_list:
+            raise VideoProcessingError("No files provided for merging")
+        
+        self._check_inputs(file_list)
+        self._check_compatible(file_list)
+        _prefetch(file_list)
+        list_file = self._write_concat_list(file_list, name)
+        
+        cmd = [
+            self.config.ffmpeg_path,
+            "-nostats",
+            "-v", "error",
+            "-fflags", "+genpts",
+            "-f", "concat",
+            "-safe", "0",
+            "-i", list_file,
+            "-c", "copy",
+            "-avoid_negative_ts", "make_zero",
+            "-f", "mp4",
+            "-movflags", "+frag_keyframe+empty_moov",
+            "pipe:1"
+        ]
+        
+        logger.info(f"Streaming merge of {len(file_list)} videos")
+        logger.debug(f"FFmpeg command: {' '.join(cmd)}")
+        
+        try:
+            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        except OSError as e:
+            os.remove(list_file)
+            raise FFmpegError(f"Failed to start FFmpeg: {e}")
+        return MergeStream(process, list_file)
+    
     def compress_video(self, input_file: str, output_file: str, 
-                      target_size_mb: Optional[float] = None) -> bool:
+                      target_size_mb: Optional[float] = None,
+                      progress: Optional[Callable[[float], None]] = None) -> bool:
         """
         Compress video to reduce file size.
         
         Args:
             input_file: Input video file path
             output_file: Output video file path
-            target_size_mb: Target file size in MB
+            target_size_mb: Target file size in MB (the video bitrate is
+                derived from it, capped at the source's bitrate)
+            progress: Optional callback receiving the encoded position in seconds
             
         Returns:
             True if compression successful
@@ -202,26 +585,257 @@ class VideoProcessor:
         ]
         
         if target_size_mb:
+            # Duration and source bitrate come from one (cached) probe
+            video_format = self.get_video_info(input_file).get("format", {})
+            try:
+                duration = float(video_format["duration"])
+            except (KeyError, TypeError, ValueError):
+                duration = self.get_video_duration(input_file)
+            
             # Calculate bitrate for target file size
-            duration = self.get_video_duration(input_file)
             target_bitrate = int((target_size_mb * 8 * 1024) / duration)  # kbps
+            try:
+                # Never ask for more than the source already uses
+                target_bitrate = min(target_bitrate, int(video_format["bit_rate"]) // 1000)
+            except (KeyError, TypeError, ValueError):
+                pass
             cmd.extend(["-b:v", f"{target_bitrate}k"])
         
         cmd.extend(["-c:a", "aac", "-b:a", "128k", "-y", output_file])
         
+        self._run_ffmpeg(cmd, "Video compression failed", progress)
+        logger.info(f"Successfully compressed video: {output_file}")
+        return True
+    
+    def merge_and_compress(self, file_list: List[str], output_file: str, crf: int = 23,
+                           copy_if_compatible: bool = False,
+                           progress: Optional[Callable[[float], None]] = None) -> bool:
+        """
+        Merge videos and re-encode the result in a single FFmpeg run, without
+        an intermediate merged file.
+        
+        Encodes like compress_video (libx264 ``medium``, AAC 128k). With
+        ``copy_if_compatible``, inputs that are already H.264/AAC with
+        matching parameters are stream-copied instead (see merge_videos),
+        which ignores ``crf`` and so does not compress.
+        
+        Args:
+            file_list: List of video file paths to merge, in playback order
+            output_file: Output file path (overwritten)
+            crf: x264 constant rate factor
+            copy_if_compatible: Whether to stream-copy already-encoded inputs
+                rather than re-encode them
+            progress: Optional callback receiving the output position in seconds
+            
+        Returns:
+            True if successful
+            
+        Raises:
+            FFmpegError: If FFmpeg fails
+            VideoProcessingError: If input validation fails
+        """
+        if not file_list:
+            raise VideoProcessingError("No files provided for merging")
+        
+        self._check_inputs(file_list)
+        
+        if copy_if_compatible:
+            try:
+                signature = self._check_compatible(file_list)
+            except IncompatibleVideosError:
+                signature = None
+            if signature is not None and signature[0] == "h264" and signature[5] in ("aac", None):
+                logger.info("Inputs are already H.264/AAC, merging without re-encoding")
+                return self.merge_videos(file_list, output_file, overwrite=True, progress=progress)
+        
+        _prefetch(file_list)
+        output_stem = os.path.splitext(os.path.basename(output_file))[0]
+        list_file = self._write_concat_list(file_list, output_stem)
+        
+        cmd = [
+            self.config.ffmpeg_path,
+            "-fflags", "+genpts",
+            "-f", "concat",
+            "-safe", "0",
+            "-i", list_file,
+            "-c:v", "libx264",
+            "-preset", "medium",
+            "-crf", str(crf),
+            "-c:a", "aac", "-b:a", "128k",
+            "-y", output_file
+        ]
+        
+        logger.info(f"Merging and compressing {len(file_list)} videos to {output_file}")
+        logger.debug(f"FFmpeg command: {' '.join(cmd)}")
+        
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            logger.info(f"Successfully compressed video: {output_file}")
+            self._run_ffmpeg(cmd, "FFmpeg merge and compress failed", progress)
+            logger.info(f"Successfully merged and compressed videos to {output_file}")
             return True
-        except subprocess.CalledProcessError as e:
-            error_msg = f"Video compression failed: {e.stderr}"
-            logger.error(error_msg)
-            raise FFmpegError(error_msg)
+        finally:
+            try:
+                os.remove(list_file)
+            except OSError:
+                pass
+
+
+class MergeStream:
+    """
+    A running streaming merge started by ``VideoProcessor.start_merge_stream``.
+    
+    Read the merged video from ``stdout``, then call ``close()`` (or use the
+    stream as a context manager) to reap FFmpeg and remove the concat list.
+    Once ``stdout`` is at EOF, ``wait()`` tells whether the output is complete.
+    """
+    
+    def __init__(self, process: subprocess.Popen, list_file: str):
+        self.process = process
+        self.stdout = process.stdout
+        self._list_file = list_file
+        
+        # stderr is drained on a thread, keeping only the last lines: unread,
+        # a full pipe would block FFmpeg while the consumer waits on stdout
+        self._stderr_tail = collections.deque(maxlen=1024)
+        self._stderr_reader = threading.Thread(
+            target=self._drain_stderr, name='merge-stderr', daemon=True
+        )
+        self._stderr_reader.start()
+    
+    def __enter__(self) -> 'MergeStream':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Don't let a merge error mask the exception already propagating
+        try:
+            self.close()
+        except FFmpegError:
+            if exc_type is None:
+                raise
+    
+    def _drain_stderr(self):
+        with self.process.stderr:
+            for raw_line in self.process.stderr:
+                self._stderr_tail.append(raw_line.decode('utf-8', errors='replace').rstrip())
+    
+    def wait(self):
+        """
+        Wait for FFmpeg to exit. Safe to call more than once.
+        
+        Raises:
+            FFmpegError: If FFmpeg exited with an error
+        """
+        self.process.wait()
+        self._stderr_reader.join()
+        
+        if self.process.returncode != 0:
+            raise FFmpegError("FFmpeg streaming merge failed: " + "\n".join(self._stderr_tail))
+    
+    def close(self):
+        """
+        Wait for FFmpeg to exit and clean up.
+        
+        Raises:
+            FFmpegError: If FFmpeg exited with an error
+        """
+        # Closing our end first unblocks an FFmpeg still writing when the
+        # consumer stopped early
+        self.stdout.close()
+        try:
+            self.wait()
+        finally:
+            try:
+                os.remove(self._list_file)
+            except OSError:
+                pass
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_timestamp(timestamp: str) -> datetime:
+    """
+    Parse a "YYYY-MM-DD HH-MM-SS" filename timestamp, memoized (datetimes are
+    immutable).
+    
+    The fixed layout is sliced directly; anything else goes through strptime
+    (which also supplies the error message for invalid values).
+    
+    Raises:
+        ValueError: If the timestamp is not a valid date/time
+    """
+    if (len(timestamp) == 19 and timestamp[4] == timestamp[7] == "-" and timestamp[10] == " "
+            and timestamp[13] == timestamp[16] == "-"):
+        digits = (timestamp[0:4] + timestamp[5:7] + timestamp[8:10]
+                  + timestamp[11:13] + timestamp[14:16] + timestamp[17:19])
+        if digits.isascii() and digits.isdigit():
+            try:
+                return datetime(int(digits[0:4]), int(digits[4:6]), int(digits[6:8]),
+                                int(digits[8:10]), int(digits[10:12]), int(digits[12:14]))
+            except ValueError:
+                pass
+    return datetime.strptime(timestamp, "%Y-%m-%d %H-%M-%S")
+
+
+class _ParsedName(NamedTuple):
+    """Fields of a video filename, as parsed by ``_parse``."""
+    user: Optional[str]  # None if there are fewer than three " - " fields
+    activity: Optional[str]  # First two activity words, lowercased; None if fewer
+    timestamp: Optional[datetime]  # Unadjusted; None if missing or invalid
+    timestamp_error: Optional[str]  # Why timestamp is None, if it is
+    clip_desc: str
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse(filename: str) -> _ParsedName:
+    """
+    Parse every field FilenameParser needs from a filename in one pass.
+    
+    Memoized; failures are recorded in the result rather than raised, so that
+    each public method can raise its own error.
+    """
+    user = activity = None
+    match = FilenameParser._TITLE_RE.match(filename)
+    if match is not None:
+        user = match.group('user')
+        activity_words = match.group('activity').split(None, 2)
+        if len(activity_words) >= 2:
+            activity = f"{activity_words[0]} {activity_words[1]}".lower()
+    
+    timestamp = timestamp_error = None
+    match = FilenameParser._DT_RE.match(filename)
+    if match is not None:
+        try:
+            timestamp = _parse_timestamp(match.group(1))
+        except ValueError as e:
+            timestamp_error = f"Invalid datetime format in filename {filename}: {e}"
+    else:
+        timestamp_error = f"Invalid datetime format in filename {filename}"
+    
+    clip_desc = filename[:-4] if filename.endswith(".mp4") else filename
+    separator = clip_desc.find(" - ")
+    if separator >= 0:
+        clip_desc = clip_desc[separator + 3:]
+    
+    return _ParsedName(user, activity, timestamp, timestamp_error, clip_desc)
 
 
 class FilenameParser:
     """Handles parsing and validation of video filenames."""
     
+    # "YYYY-MM-DD HH-MM-SS - <username> - <activity>....mp4"; matching this
+    # first lets callers reject foreign names without raising
+    FILENAME_RE = re.compile(
+        r'^(?P<timestamp>\d{4}-\d{2}-\d{2} \d{2}-\d{2}-\d{2}) - .*\.mp4\Z'
+    )
+    
+    # "<timestamp> - <user> - <activity>[ (...)][ - ...]": user and activity
+    # are the second and third " - " separated fields, activity cut at " ("
+    _TITLE_RE = re.compile(
+        r'^(?:(?! - ).)* - (?P<user>(?:(?! - ).)*) - (?P<activity>(?:(?! - | \().)*)',
+        re.DOTALL
+    )
+    
+    # Timestamp making up the whole first " - " separated field
+    _DT_RE = re.compile(r'^(\d{4}-\d{2}-\d{2} \d{2}-\d{2}-\d{2})(?: - |\Z)')
+    
     def __init__(self, config: VideoConfig):
         self.config = config
     
@@ -238,27 +852,19 @@ class FilenameParser:
         Raises:
             InvalidFilenameError: If filename format is invalid
         """
+        parsed = _parse(filename)
+        if parsed.user is None:
+            raise InvalidFilenameError(f"Invalid filename format: {filename}")
+        if parsed.activity is None:
+            raise InvalidFilenameError(f"Not enough words in activity part: {filename}")
+        
         try:
-            parts = filename.split(" - ")
-            if len(parts) < 3:
-                raise InvalidFilenameError(f"Invalid filename format: {filename}")
-            
-            username = parts[1]
-            activity_part = parts[2].split(" (")[0]
-            activity_words = activity_part.split()
-            
-            if len(activity_words) < 2:
-                raise InvalidFilenameError(f"Not enough words in activity part: {filename}")
-            
-            first_two_words = " ".join(activity_words[:2]).lower()
-            
             # Use configurable title template
             return self.config.individual_video_title_template.format(
-                username=username,
-                activity=first_two_words,
+                username=parsed.user,
+                activity=parsed.activity,
                 filename=filename
             )
-            
         except Exception as e:
             raise InvalidFilenameError(f"Error parsing title from {filename}: {e}")
     
@@ -275,23 +881,43 @@ class FilenameParser:
         Raises:
             InvalidFilenameError: If datetime parsing fails
         """
-        try:
-            parts = filename.split(" - ")
-            full_timestamp = parts[0]
-            dt = datetime.strptime(full_timestamp, "%Y-%m-%d %H-%M-%S")
+        parsed = _parse(filename)
+        if parsed.timestamp is None:
+            raise InvalidFilenameError(parsed.timestamp_error)
+        
+        # Adjust for early morning videos (not cached: the cutoff is per config)
+        dt = parsed.timestamp
+        if dt.hour < self.config.early_morning_cutoff:
+            dt -= timedelta(days=1)
             
-            # Adjust for early morning videos
-            if dt.hour < self.config.early_morning_cutoff:
-                dt -= timedelta(days=1)
-                
-            return dt
-        except Exception as e:
-            raise InvalidFilenameError(f"Invalid datetime format in filename {filename}: {e}")
+        return dt
     
     def get_video_date(self, filename: str):
         """Get the date component from filename."""
         return self.get_video_datetime(filename).date()
     
+    def get_match_date(self, match: re.Match) -> date:
+        """
+        Get the (early-morning adjusted) date from a ``FILENAME_RE`` match.
+        
+        Args:
+            match: Successful ``FILENAME_RE`` match
+            
+        Returns:
+            Video date
+            
+        Raises:
+            InvalidFilenameError: If the timestamp is not a real date/time
+        """
+        try:
+            dt = _parse_timestamp(match.group('timestamp'))
+        except ValueError as e:
+            raise InvalidFilenameError(f"Invalid datetime format in filename {match.string}: {e}")
+        
+        if dt.hour < self.config.early_morning_cutoff:
+            dt -= timedelta(days=1)
+        return dt.date()
+    
     def extract_clip_description(self, filename: str) -> str:
         """
         Extract clip description from filename.
@@ -302,10 +928,210 @@ class FilenameParser:
         Returns:
             Clip description without timestamp and extension
         """
-        if filename.endswith(".mp4"):
-            filename = filename[:-4]
+        return _parse(filename).clip_desc
+
+
+@dataclass
+class VideoEntry:
+    """
+    A pending recording, as found by one directory scan.
+    
+    Size and mtime come from that single stat, so later steps (cache
+    validation, logging, cleanup) never stat the file again.
+    """
+    __slots__ = ('name', 'path', 'size', 'mtime')
+    
+    name: str
+    path: str
+    size: int
+    mtime: float
+    
+    @classmethod
+    def from_dir_entry(cls, entry: os.DirEntry) -> 'VideoEntry':
+        """Build from an ``os.scandir`` entry (one stat, cached by scandir)."""
+        st = entry.stat(follow_symlinks=False)
+        return cls(entry.name, entry.path, st.st_size, st.st_mtime)
+
+
+class MetadataCache:
+    """
+    Persistent cache of per-file metadata: the parsed filename fields and the
+    ffprobe duration, plus raw ffprobe output for ``VideoProcessor`` (see
+    get_probe).
+    
+    Rows are keyed by filename and only trusted while the file's mtime and
+    size as recorded in its VideoEntry (and the configured early-morning
+    cutoff) still match, so a replaced or re-encoded recording is re-parsed
+    and re-probed automatically. New rows are buffered in memory and written
+    in a single batch by ``flush()``. Safe to share between upload worker
+    threads.
+    """
+    
+    def __init__(self, db_path: str, filename_parser: FilenameParser,
+                 video_processor: VideoProcessor):
+        self.db_path = db_path
+        self.filename_parser = filename_parser
+        self.video_processor = video_processor
+        self._conn: Optional[sqlite3.Connection] = None
+        self._rows: Dict[str, tuple] = {}
+        self._dirty: Dict[str, tuple] = {}
+        self._probes: Dict[str, tuple] = {}
+        self._probes_dirty: Dict[str, tuple] = {}
+        self._lock = threading.Lock()
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use and load all cached rows."""
+        with self._lock:
+            if self._conn is None:
+                self._open()
+        return self._conn
+    
+    def _open(self):
+        """Connect, create the schema if needed and load every row (lock held)."""
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS metadata ("
+            "filename TEXT PRIMARY KEY, mtime REAL, size INTEGER, cutoff INTEGER, "
+            "vdate TEXT, vdt TEXT, clip_desc TEXT, duration REAL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS probe ("
+            "path TEXT PRIMARY KEY, mtime REAL, size INTEGER, info TEXT)"
+        )
+        for row in self._conn.execute("SELECT * FROM metadata"):
+            self._rows[row[0]] = row
+        logger.debug(f"Loaded {len(self._rows)} cached metadata rows from {self.db_path}")
+    
+    def _entry(self, video: VideoEntry) -> tuple:
+        """
+        Return the cached row for ``video``, (re)parsing the filename if the
+        row is missing or stale.
+        
+        Raises:
+            InvalidFilenameError: If the filename cannot be parsed
+        """
+        self._connect()
+        filename = video.name
+        cutoff = self.filename_parser.config.early_morning_cutoff
+        
+        row = self._rows.get(filename)
+        if row is not None and row[1] == video.mtime and row[2] == video.size and row[3] == cutoff:
+            return row
+        
+        dt = self.filename_parser.get_video_datetime(filename)
+        row = (
+            filename, video.mtime, video.size, cutoff,
+            dt.date().isoformat(), dt.isoformat(),
+            self.filename_parser.extract_clip_description(filename),
+            None
+        )
+        self._store(row)
+        return row
+    
+    def _store(self, row: tuple):
+        """Update the in-memory row and queue it for the next flush."""
+        with self._lock:
+            self._rows[row[0]] = row
+            self._dirty[row[0]] = row
+    
+    def get_video_datetime(self, video: VideoEntry) -> datetime:
+        """Cached ``FilenameParser.get_video_datetime`` for ``video``."""
+        return datetime.fromisoformat(self._entry(video)[5])
+    
+    def extract_clip_description(self, video: VideoEntry) -> str:
+        """Cached ``FilenameParser.extract_clip_description`` for ``video``."""
+        return self._entry(video)[6]
+    
+    def get_video_durations(self, videos: List[VideoEntry]) -> Dict[str, float]:
+        """
+        Cached ``VideoProcessor.get_video_durations`` for ``videos``; only the
+        files without a cached duration are probed.
         
-        parts = filename.split(" - ")
-        if len(parts) > 1:
-            return " - ".join(parts[1:])
-        return filename
+        Returns:
+            Duration in seconds by path; videos whose filename or probe fails
+            are logged and left out
+        """
+        durations = {}
+        rows = {}
+        for video in videos:
+            try:
+                row = self._entry(video)
+            except InvalidFilenameError as e:
+                logger.warning(f"Could not get duration for {video.path}: {e}")
+                continue
+            if row[7] is None:
+                rows[video.path] = row
+            else:
+                durations[video.path] = row[7]
+        
+        if rows:
+            probed = self.video_processor.get_video_durations(list(rows))
+            for path, duration in probed.items():
+                self._store(rows[path][:7] + (duration,))
+            durations.update(probed)
+        return durations
+    
+    def get_probe(self, path: str, st: os.stat_result) -> Optional[str]:
+        """
+        Return the cached ffprobe output for ``path``, or None if missing or
+        stale. Like metadata rows, entries are only trusted while the file's
+        mtime and size still match.
+        
+        Args:
+            path: Absolute path of the probed file
+            st: Current stat result of the file
+        """
+        with self._lock:
+            if self._conn is None:
+                self._open()
+            row = self._probes.get(path)
+            if row is None:
+                row = self._conn.execute(
+                    "SELECT * FROM probe WHERE path = ?", (path,)
+                ).fetchone()
+        if row is not None and row[1] == st.st_mtime and row[2] == st.st_size:
+            return row[3]
+        return None
+    
+    def put_probe(self, path: str, st: os.stat_result, info: str):
+        """Store ffprobe output for ``path`` as of ``st``, written on the next flush."""
+        row = (path, st.st_mtime, st.st_size, info)
+        with self._lock:
+            self._probes[path] = row
+            self._probes_dirty[path] = row
+    
+    def flush(self):
+        """Write all new or updated rows to the database in one batch."""
+        with self._lock:
+            self._flush_locked()
+    
+    def _flush_locked(self):
+        """Batch-write dirty rows; the caller must hold ``self._lock``."""
+        if not (self._dirty or self._probes_dirty) or self._conn is None:
+            return
+        try:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO metadata VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    list(self._dirty.values())
+                )
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO probe VALUES (?, ?, ?, ?)",
+                    list(self._probes_dirty.values())
+                )
+            logger.debug(f"Saved {len(self._dirty)} metadata rows and "
+                         f"{len(self._probes_dirty)} ffprobe results to {self.db_path}")
+            self._dirty.clear()
+            self._probes_dirty.clear()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to save metadata cache: {e}")
+    
+    def close(self):
+        """Flush pending rows and close the database."""
+        with self._lock:
+            self._flush_locked()
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
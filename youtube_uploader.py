@@ -1,29 +1,197 @@
 """
 Enhanced YouTube uploader with improved OAuth2 handling and error recovery.
 """
+from __future__ import annotations
+
 import os
+import mmap
 import time
 import logging
-from typing import Optional, Dict, Any
+import mimetypes
+import threading
+import subprocess
+import importlib.util
+from typing import Callable, Optional, Dict, Any
 from pathlib import Path
 
-# Google API imports
-try:
+# Google API libraries are expensive to import, so only check that they are
+# installed here and import them on first use (see _load_google_apis)
+GOOGLE_APIS_AVAILABLE = all(
+    importlib.util.find_spec(name) is not None
+    for name in ('google_auth_oauthlib', 'googleapiclient')
+)
+
+Credentials = None
+InstalledAppFlow = None
+Request = None
+build = None
+HttpError = None
+MediaFileUpload = None
+StreamMediaUpload = None
+MmapMediaUpload = None
+
+from config import VideoConfig
+from exceptions import YouTubeUploadError, AuthenticationError
+from retry import retry_with_backoff, backoff_delay
+
+# __EMBED_SECRETS__
+
+logger = logging.getLogger(__name__)
+
+# HTTP statuses worth retrying: rate limiting and transient server errors
+RETRIABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Resumable upload chunk size: bounds memory per request and what a failed
+# request has to resend (must be a multiple of 256 KiB)
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+class _UploadIncomplete(Exception):
+    """Raised inside the retry loop when _execute_upload gave up on a request."""
+
+
+# Serializes credential loading/refresh so concurrent uploaders never run
+# more than one OAuth flow or write the token file at the same time
+_CREDENTIALS_LOCK = threading.Lock()
+
+
+def _load_google_apis() -> None:
+    """Import the Google API client stack into module globals on first use."""
+    global Credentials, InstalledAppFlow, Request, build, HttpError, MediaFileUpload
+    global StreamMediaUpload, MmapMediaUpload
+    
+    if build is not None:
+        return
+    
     from google.oauth2.credentials import Credentials
     from google_auth_oauthlib.flow import InstalledAppFlow
     from google.auth.transport.requests import Request
     from googleapiclient.discovery import build
     from googleapiclient.errors import HttpError
-    from googleapiclient.http import MediaFileUpload
-    GOOGLE_APIS_AVAILABLE = True
-except ImportError:
-    GOOGLE_APIS_AVAILABLE = False
+    from googleapiclient.http import MediaFileUpload, MediaUpload
+    StreamMediaUpload = _make_stream_media_upload(MediaUpload)
+    MmapMediaUpload = _make_mmap_media_upload(MediaUpload)
+    logger.debug("Loaded Google API libraries")
 
-from config import VideoConfig
-from exceptions import YouTubeUploadError, AuthenticationError
 
+def _make_stream_media_upload(base):
+    """Build the MediaUpload subclass used for pipe uploads (see upload_stream)."""
+    
+    class _StreamMediaUpload(base):
+        """
+        Resumable upload body read sequentially from a non-seekable stream.
+        
+        MediaIoBaseUpload seeks to learn the size up front, which a pipe
+        cannot do. This reports an unknown size instead, so the client sends
+        '*' as the total and finishes on the first short chunk. Bytes not yet
+        acknowledged by the server are kept so a retried chunk can be re-sent.
+        
+        Since a short chunk finalises the upload, ``on_eof`` (if given) is
+        called when the stream runs dry and before that chunk is returned; it
+        should raise if the producer failed, so a truncated video is never
+        published.
+        """
+        
+        def __init__(self, fd, mimetype: str, chunksize: int,
+                     on_eof: Optional[Callable[[], None]] = None):
+            self._fd = fd
+            self._mimetype = mimetype
+            self._chunksize = chunksize
+            self._on_eof = on_eof
+            self._buf = bytearray()
+            self._buf_begin = 0
+        
+        def chunksize(self):
+            return self._chunksize
+        
+        def mimetype(self):
+            return self._mimetype
+        
+        def size(self):
+            return None
+        
+        def resumable(self):
+            return True
+        
+        def has_stream(self):
+            return False
+        
+        def getbytes(self, begin, length):
+            if begin < self._buf_begin:
+                raise YouTubeUploadError("Cannot rewind a streamed upload")
+            
+            # Everything before 'begin' has been acknowledged
+            del self._buf[:begin - self._buf_begin]
+            self._buf_begin = begin
+            
+            while len(self._buf) < length:
+                data = self._fd.read(length - len(self._buf))
+                if not data:
+                    if self._on_eof is not None:
+                        try:
+                            self._on_eof()
+                        except Exception as e:
+                            raise YouTubeUploadError(f"Upload source failed: {e}") from e
+                    break
+                self._buf += data
+            return bytes(self._buf[:length])
+    
+    return _StreamMediaUpload
 
-logger = logging.getLogger(__name__)
+
+def _make_mmap_media_upload(base):
+    """Build the MediaUpload subclass used for file uploads (see upload_video)."""
+    
+    class _MmapMediaUpload(base):
+        """
+        Resumable upload body served from a read-only memory map of a file.
+        
+        MediaFileUpload reads every chunk into a new bytes object; this hands
+        the HTTP layer memoryview slices of the mapping instead, so chunk data
+        goes from the page cache to the socket without an extra copy.
+        """
+        
+        def __init__(self, file_path: str, chunksize: int):
+            self._mimetype = mimetypes.guess_type(file_path)[0] or 'application/octet-stream'
+            self._chunksize = chunksize
+            self._fd = open(file_path, 'rb')
+            try:
+                # Raises ValueError for an empty file
+                self._mm = mmap.mmap(self._fd.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                self._fd.close()
+                raise
+            self._view = memoryview(self._mm)
+        
+        def chunksize(self):
+            return self._chunksize
+        
+        def mimetype(self):
+            return self._mimetype
+        
+        def size(self):
+            return len(self._mm)
+        
+        def resumable(self):
+            return True
+        
+        def has_stream(self):
+            return False
+        
+        def getbytes(self, begin, length):
+            return self._view[begin:begin + length]
+        
+        def close(self):
+            """Unmap and close the file (needed before it can be deleted on Windows)."""
+            self._view.release()
+            try:
+                self._mm.close()
+            except BufferError:
+                # A chunk slice is still referenced; the map closes once it is freed
+                pass
+            self._fd.close()
+    
+    return _MmapMediaUpload
 
 
 class YouTubeUploader:
@@ -240,11 +408,40 @@ class YouTubeUploader:
         if not GOOGLE_APIS_AVAILABLE:
             raise YouTubeUploadError("Google API libraries not available")
         
-        if not self.service or not self._credentials or not self._credentials.valid:
-            self._credentials = self._get_credentials()
-            self.service = build('youtube', 'v3', credentials=self._credentials)
+        _load_google_apis()
+        
+        # Built once per uploader and reused: the authorized http transport
+        # refreshes an expired access token by itself before each request
+        if not self.service:
+            with _CREDENTIALS_LOCK:
+                self._credentials = self._get_credentials()
+            # Uses the discovery document shipped with the client library, so
+            # building never fetches it over the network (the on-disk
+            # discovery cache only works with oauth2client < 4)
+            self.service = build('youtube', 'v3', credentials=self._credentials,
+                                 static_discovery=True, cache_discovery=False)
             logger.debug("Built YouTube API service")
     
+    def _build_body(self, title: str, description: str, privacy: Optional[str],
+                    category: Optional[str], tags: Optional[list]) -> Dict[str, Any]:
+        """Build the videos.insert request body, filling in configured defaults."""
+        # Use defaults if not provided
+        privacy = privacy or self.config.default_privacy
+        category = category or self.config.default_category
+        tags = tags or self.config.default_tags
+        
+        return {
+            'snippet': {
+                'title': title,
+                'description': description,
+                'tags': list(tags),
+                'categoryId': category
+            },
+            'status': {
+                'privacyStatus': privacy
+            }
+        }
+    
     def upload_video(self, file_path: str, title: str, description: str = "",
                     privacy: Optional[str] = None, category: Optional[str] = None,
                     tags: Optional[list] = None) -> Optional[str]:
@@ -272,72 +469,129 @@ class YouTubeUploader:
         if not os.path.exists(file_path):
             raise YouTubeUploadError(f"Video file not found: {file_path}")
         
+        _load_google_apis()
+        
         # Check file size
         file_size = os.path.getsize(file_path) / (1024 ** 3)  # GB
         if file_size > self.config.max_file_size_gb:
             logger.warning(f"File size ({file_size:.2f}GB) exceeds limit ({self.config.max_file_size_gb}GB)")
         
-        # Use defaults if not provided
-        privacy = privacy or self.config.default_privacy
-        category = category or self.config.default_category
-        tags = tags or self.config.default_tags
+        body = self._build_body(title, description, privacy, category, tags)
         
-        body = {
-            'snippet': {
-                'title': title,
-                'description': description,
-                'tags': tags,
-                'categoryId': category
-            },
-            'status': {
-                'privacyStatus': privacy
-            }
-        }
+        # Prepare media upload (memory-mapped; empty or unmappable files use
+        # the regular reader)
+        try:
+            media = MmapMediaUpload(file_path, UPLOAD_CHUNK_SIZE)
+        except (OSError, ValueError):
+            media = MediaFileUpload(
+                file_path,
+                chunksize=UPLOAD_CHUNK_SIZE,
+                resumable=True
+            )
         
-        # Prepare media upload
-        media = MediaFileUpload(
-            file_path,
-            chunksize=-1,  # Upload in single request
-            resumable=True
-        )
+        def is_retriable(e: Exception) -> bool:
+            if isinstance(e, HttpError):
+                return e.resp.status in RETRIABLE_STATUS_CODES
+            return True
         
-        for attempt in range(self.config.max_retries):
-            try:
-                self._build_service()
-                
-                logger.info(f"Uploading video (attempt {attempt + 1}/{self.config.max_retries}): {title}")
-                
-                request = self.service.videos().insert(
-                    part=','.join(body.keys()),
-                    body=body,
-                    media_body=media
-                )
-                
-                response = self._execute_upload(request)
-                
-                if response:
-                    video_id = response['id']
-                    logger.info(f"Successfully uploaded video: {video_id}")
-                    return video_id
-                
-            except HttpError as e:
-                if e.resp.status in [500, 502, 503, 504]:
-                    # Retriable HTTP errors
-                    logger.warning(f"Retriable HTTP error {e.resp.status}: {e}")
-                    if attempt < self.config.max_retries - 1:
-                        time.sleep(self.config.retry_delay * (2 ** attempt))  # Exponential backoff
-                        continue
-                else:
-                    # Non-retriable error
-                    raise YouTubeUploadError(f"HTTP error {e.resp.status}: {e}")
+        @retry_with_backoff(self.config.max_retries, self.config.retry_delay,
+                            should_retry=is_retriable)
+        def insert_video() -> Dict[str, Any]:
+            self._build_service()
             
-            except Exception as e:
-                logger.error(f"Upload attempt {attempt + 1} failed: {e}")
-                if attempt < self.config.max_retries - 1:
-                    time.sleep(self.config.retry_delay * (2 ** attempt))
-                    continue
-                else:
-                    raise YouTubeUploadError(f"Upload failed after {self.config.max_retries} attempts: {e}")
+            logger.info(f"Uploading video: {title}")
+            
+            request = self.service.videos().insert(
+                part=','.join(body.keys()),
+                body=body,
+                media_body=media
+            )
+            
+            response = self._execute_upload(request)
+            if not response:
+                raise _UploadIncomplete("Upload did not complete")
+            return response
+        
+        try:
+            response = insert_video()
+        except HttpError as e:
+            if is_retriable(e):
+                # Still failing after all retries; let the caller fall back
+                logger.error(f"Upload failed after {self.config.max_retries} attempts: HTTP error {e.resp.status}")
+                return None
+            # Non-retriable error
+            raise YouTubeUploadError(f"HTTP error {e.resp.status}: {e}")
+        except _UploadIncomplete:
+            logger.error(f"Upload did not complete after {self.config.max_retries} attempts")
+            return None
+        except Exception as e:
+            raise YouTubeUploadError(f"Upload failed after {self.config.max_retries} attempts: {e}")
+        finally:
+            if isinstance(media, MmapMediaUpload):
+                media.close()
+        
+        video_id = response['id']
+        logger.info(f"Successfully uploaded video: {video_id}")
+        return video_id
+    
+    def upload_stream(self, stream, title: str, description: str = "",
+                      privacy: Optional[str] = None, category: Optional[str] = None,
+                      tags: Optional[list] = None,
+                      chunk_size: int = UPLOAD_CHUNK_SIZE,
+                      on_eof: Optional[Callable[[], None]] = None) -> Optional[str]:
+        """
+        Upload video read sequentially from a non-seekable stream (e.g. the
+        stdout of a streaming FFmpeg merge).
+        
+        The body cannot be replayed, so there is a single attempt (each chunk
+        is still retried by _execute_upload); callers should fall back to a
+        file upload when this returns None or raises.
+        
+        Args:
+            stream: Binary file-like object to read the video from
+            title: Video title
+            description: Video description
+            privacy: Privacy setting (private, public, unlisted)
+            category: YouTube category ID
+            tags: List of tags
+            chunk_size: Bytes per resumable chunk (multiple of 256 KiB)
+            on_eof: Called once the stream is exhausted, before the final
+                chunk is sent; raising aborts the upload unfinished
+            
+        Returns:
+            Video ID if successful, None otherwise
+            
+        Raises:
+            YouTubeUploadError: If the upload is rejected or ``on_eof`` raises
+        """
+        if not GOOGLE_APIS_AVAILABLE:
+            logger.error("Cannot upload: Google API libraries not available")
+            return None
+        
+        _load_google_apis()
+        
+        body = self._build_body(title, description, privacy, category, tags)
+        media = StreamMediaUpload(stream, 'video/mp4', chunk_size, on_eof)
+        
+        try:
+            self._build_service()
+            
+            logger.info(f"Streaming upload: {title}")
+            
+            request = self.service.videos().insert(
+                part=','.join(body.keys()),
+                body=body,
+                media_body=media
+            )
+            
+            response = self._execute_upload(request)
+        except HttpError as e:
+            raise YouTubeUploadError(f"HTTP error {e.resp.status}: {e}")
+        
+        if response:
+            video_id = response['id']
+            logger.info(f"Successfully uploaded video: {video_id}")
+            return video_id
         
         return None
     
@@ -352,19 +606,29 @@ class YouTubeUploader:
             Upload response or None if failed
         """
         response = None
-        error = None
         retry = 0
         
         while response is None:
+            error = None
             try:
                 status, response = request.next_chunk()
+                # Retries are per chunk: a long upload may see many transient
+                # errors in total
+                retry = 0
                 if status:
-                    logger.debug(f"Upload progress: {int(status.progress() * 100)}%")
+                    sent_mb = status.resumable_progress / (1024 ** 2)
+                    if status.total_size:
+                        logger.debug(f"Upload progress: {int(status.progress() * 100)}% ({sent_mb:.0f} MiB)")
+                    else:
+                        logger.debug(f"Upload progress: {sent_mb:.0f} MiB")
             except HttpError as e:
-                if e.resp.status in [500, 502, 503, 504]:
+                if e.resp.status in RETRIABLE_STATUS_CODES:
                     error = f"A retriable HTTP error {e.resp.status} occurred: {e.content}"
                 else:
                     raise e
+            except YouTubeUploadError:
+                # Raised by the media body itself; resending cannot help
+                raise
             except Exception as e:
                 error = f"An error occurred: {e}"
             
@@ -375,9 +639,8 @@ class YouTubeUploader:
                     logger.error("Upload failed after maximum retries")
                     return None
                 
-                max_sleep = 2 ** retry
-                sleep_seconds = min(max_sleep, self.config.retry_delay)
-                logger.info(f"Sleeping {sleep_seconds} seconds and then retrying...")
+                sleep_seconds = backoff_delay(retry - 1, self.config.retry_delay)
+                logger.info(f"Sleeping {sleep_seconds:.1f} seconds and then retrying...")
                 time.sleep(sleep_seconds)
         
         return response
@@ -429,8 +692,6 @@ class FallbackUploader:
         Returns:
             True if upload successful
         """
-        import subprocess
-        
         cmd = ["youtube-upload", "--title", title]
         if description:
             cmd.extend(["--description", description])
@@ -438,18 +699,16 @@ class FallbackUploader:
         
         logger.info(f"Using fallback uploader: {' '.join(cmd)}")
         
-        for attempt in range(self.config.max_retries):
-            try:
-                result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-                logger.info(f"Fallback upload successful: {result.stdout}")
-                return True
-            except subprocess.CalledProcessError as e:
-                logger.warning(f"Fallback upload attempt {attempt + 1} failed: {e.stderr}")
-                if attempt < self.config.max_retries - 1:
-                    time.sleep(self.config.retry_delay)
-                    continue
-                else:
-                    logger.error(f"Fallback upload failed after {self.config.max_retries} attempts")
-                    return False
+        @retry_with_backoff(self.config.max_retries, self.config.retry_delay,
+                            retry_on=(subprocess.CalledProcessError,))
+        def run_uploader() -> subprocess.CompletedProcess:
+            return subprocess.run(cmd, capture_output=True, text=True, check=True)
+        
+        try:
+            result = run_uploader()
+        except subprocess.CalledProcessError as e:
+            logger.error(f"Fallback upload failed after {self.config.max_retries} attempts: {e.stderr}")
+            return False
         
-        return False
+        logger.info(f"Fallback upload successful: {result.stdout}")
+        return True
@@ -0,0 +1,128 @@
+# -*- mode: python ; coding: utf-8 -*-
+import os
+import sys
+
+block_cipher = None
+
+# Stripping shells out to GNU strip, which is usually missing on Windows and
+# corrupts PE DLLs/PYDs when it is present, so only strip elsewhere
+STRIP_BINARIES = not sys.platform.startswith('win')
+
+# UPX reads its default options from the UPX environment variable;
+# EXE() has no argument for passing compression flags through.
+os.environ.setdefault('UPX', '--best --lzma')
+
+# Analyse the staged sources (build_executable.py writes them to build_tmp/
+# with the client secrets embedded), never the checked-in modules
+a = Analysis(
+    [os.path.join('build_tmp', 'run.py')],
+    pathex=[os.path.join(SPECPATH, 'build_tmp')],
+    binaries=[],
+    datas=[],
+    hiddenimports=[
+        # Only the Google API entry points youtube_uploader actually touches
+        'google.oauth2.credentials',
+        'google.auth.transport.requests',
+        'google_auth_oauthlib.flow',
+        'googleapiclient.discovery',
+        'googleapiclient.errors',
+        'googleapiclient.http',
+        'main',
+        'config',
+        'exceptions',
+        'retry',
+        'video_processor',
+        'youtube_uploader',
+    ],
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=['pyi_rth_dont_write_bytecode.py'],
+    excludes=[
+        'tkinter',
+        'matplotlib',
+        'numpy',
+        'pandas',
+        'scipy',
+        'PIL',
+        'PyQt5',
+        'PyQt6',
+        'PySide2',
+        'PySide6',
+        # Unused Google transports and caches (uploads only use HTTP)
+        'grpc',
+        'google.auth.transport.grpc',
+        'googleapiclient.discovery_cache.file_cache',
+        # Test tooling
+        'pytest',
+        '_pytest',
+        'unittest',
+        'doctest',
+        'test',
+        'tests',
+        # Developer/packaging tooling pulled in transitively
+        'pydoc',
+        'pydoc_data',
+        'pdb',
+        'distutils',
+        'lib2to3',
+        'setuptools',
+        'pip',
+        'idlelib',
+        'turtle',
+        # Unused stdlib protocols
+        'xmlrpc',
+        'xml.etree',
+        # NOTE: http.server must stay - run_local_server() serves the OAuth
+        # redirect through wsgiref.simple_server, which imports it
+    ],
+    win_no_prefer_redirects=False,
+    win_private_assemblies=False,
+    cipher=block_cipher,
+    noarchive=False,
+)
+
+# Modules are stored as bytecode in the PYZ; never ship loose .py sources
+a.datas = [d for d in a.datas if not d[0].endswith('.py')]
+
+pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
+
+# One-folder layout: the EXE holds only the scripts and the bootloader, while
+# COLLECT lays binaries and data out next to it, so nothing is extracted to a
+# temp directory on every start
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name='youtube_uploader',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=STRIP_BINARIES,
+    upx=True,
+    console=True,
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+    icon=None,
+)
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    strip=STRIP_BINARIES,
+    upx=True,
+    # Packing the CRT/Python DLLs is known to trigger AV false positives,
+    # and the API-set/Qt DLLs do not survive UPX compression
+    upx_exclude=[
+        'vcruntime140.dll',
+        'python3*.dll',
+        'ucrtbase.dll',
+        'api-ms-*.dll',
+        'Qt5*.dll',
+    ],
+    name='youtube_uploader',
+)